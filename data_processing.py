@@ -1,6 +1,45 @@
+import codecs
+import math
+import mmap
+import os
 import re
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from itertools import repeat
+import numpy as np
 import globals
 
+
+def record_frame_time(fno, timestamp):
+    """Stores the arrival time of frame fno in globals.frame_times."""
+    times = globals.frame_times
+    missing = fno - len(times)
+    if missing > 0:
+        times.extend(repeat(math.nan, missing))
+    times[fno - 1] = timestamp
+
+
+def frame_time(fno):
+    """Returns the arrival time of frame fno, or None if it was not timed."""
+    times = globals.frame_times
+    if 0 < fno <= len(times):
+        timestamp = times[fno - 1]
+        if not math.isnan(timestamp):
+            return timestamp
+    return None
+
+
+def frame_at_time(timestamp):
+    """
+    Returns the number of the last frame that arrived at or before timestamp,
+    or None if there is none. Untimed frames sort before every timed one.
+    """
+    fno = bisect_right(globals.frame_times, timestamp)
+    return fno if fno and frame_time(fno) is not None else None
+
+
 def format_frame(fno):
     """
     Formats the display for a frame number.
@@ -17,15 +56,7 @@ def format_frame(fno):
         # Toggle is ON, show time since the timer started.
         try:
             # Find the timestamp for the current frame
-            frame_type_key = globals.all_frame_types[fno - 1]
-            timestamps_for_type = globals.frame_timestamps.get(frame_type_key, [])
-
-            current_ts = None
-            # This loop finds the specific timestamp for the frame number 'fno'
-            for frame_num, timestamp in timestamps_for_type:
-                if frame_num == fno:
-                    current_ts = timestamp
-                    break
+            current_ts = frame_time(fno)
 
             # If found the frame's timestamp and the session start time is valid
             if current_ts is not None and globals.live_data_start_time > 0:
@@ -158,6 +189,65 @@ def compute_lin_enhanced_checksum(frame_id, databytes):
     return checksum, protected_id
 
 
+FILE_CHUNK_SIZE = 1024 * 1024
+FORMAT_SAMPLE_SIZE = 4096
+# Bytes that can appear in a hex text log (tab, newlines, printable ASCII)
+TEXT_BYTES = bytes(range(9, 14)) + bytes(range(32, 127))
+
+
+def is_binary_data(sample):
+    """
+    Returns True if the sample holds any byte that cannot appear in a hex text log.
+    Only a prefix of the file needs to be passed in (see FORMAT_SAMPLE_SIZE).
+    """
+    return bool(sample.translate(None, TEXT_BYTES))
+
+
+def read_file_pieces(file_name, as_text, chunk_size=FILE_CHUNK_SIZE):
+    """
+    Generator that reads a log file in fixed-size pieces so that files of any size
+    can be framed with bounded memory. Text is decoded incrementally, so a
+    character split between two pieces is kept intact.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace') if as_text else None
+    with open(file_name, 'rb') as f:
+        while True:
+            piece = f.read(chunk_size)
+            if not piece:
+                break
+            yield decoder.decode(piece) if decoder else piece
+    if decoder:
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
+
+
+def validate_frames(frames):
+    """
+    Vectorized compute_lin_enhanced_checksum for a batch of raw frames, given as an
+    (N, FRAME_LENGTH) uint8 array or a list of FRAME_LENGTH-byte frames.
+    Returns (valid, checksums, protected_ids) arrays, where valid is True for rows
+    whose protected ID parity and enhanced checksum both match the frame.
+    """
+    if isinstance(frames, np.ndarray):
+        frames = frames.astype(np.uint8, copy=False).reshape(-1, FRAME_LENGTH)
+    else:
+        frames = np.frombuffer(b"".join(frames), dtype=np.uint8).reshape(-1, FRAME_LENGTH)
+
+    original_ids = frames[:, 2]
+    frame_ids = original_ids & 0x3F
+    id_bits = [(frame_ids >> i) & 0x01 for i in range(6)]
+    p0 = id_bits[0] ^ id_bits[1] ^ id_bits[2] ^ id_bits[4]
+    p1 = (id_bits[1] ^ id_bits[3] ^ id_bits[4] ^ id_bits[5]) ^ 0x01
+    protected_ids = ((p1 << 7) | (p0 << 6) | frame_ids).astype(np.uint8)
+
+    checksums = protected_ids.astype(np.uint16) + frames[:, 3:-1].sum(axis=1, dtype=np.uint16)
+    checksums = (~(checksums % 255)).astype(np.uint8)
+
+    valid = (protected_ids == original_ids) & (checksums == frames[:, -1])
+    return valid, checksums, protected_ids
+
+
 def guess_format(file_content):
     lines = file_content.splitlines()
     lines = [l for l in lines if l.strip()]
@@ -170,52 +260,294 @@ def guess_format(file_content):
 
 
 def parse_hex_data(hex_data, is_spaced):
+    """
+    Converts hex text into raw bytes. Spaced text keeps only the two-character
+    tokens, unspaced text is stripped of non-hex characters and read in pairs.
+    """
     if is_spaced:
         tokens = re.split(r'\s+', hex_data.strip())
-        byte_list = [t.upper() for t in tokens if re.fullmatch(r'[0-9A-Fa-f]{2}', t)]
+        cleaned = "".join(t for t in tokens if re.fullmatch(r'[0-9A-Fa-f]{2}', t))
     else:
         cleaned = re.sub(r'[^0-9A-Fa-f]', '', hex_data)
-        byte_list = [cleaned[i:i + 2].upper() for i in range(0, len(cleaned), 2) if len(cleaned[i:i + 2]) == 2]
-    return byte_list
+        cleaned = cleaned[:len(cleaned) - len(cleaned) % 2]
+    return bytes.fromhex(cleaned)
+
 
+FRAME_LENGTH = 12
+SYNC_PATTERN = re.compile(rb"[\x00\x80]\x55")
 
-def parse_data_stream(byte_list, is_live_data=False):
+
+def parse_data_stream(data, start=0):
     """
-    Parses a list of hex byte strings to extract LIN frames and identify garbage data between them.
-    This simplified version scans for a frame header and treats all preceding bytes as a 'garbage' chunk.
+    Scans a bytes-like buffer (bytes, bytearray or memoryview) for LIN frames and
+    identifies garbage data between them. A frame starts at a 00 55 / 80 55 sync
+    and is FRAME_LENGTH bytes long; all bytes before a sync are a 'garbage' chunk.
+    Returns (chunks, remainder_offset) where chunks is a list of
+    (chunk_type, start, end) offsets into data, and remainder_offset is the first
+    byte that has not been consumed (an incomplete frame or data without a sync).
     """
     chunks = []
-    buffer = list(byte_list)
-    FULL_FRAME_LENGTH = 12
+    pos = start
+    data_end = len(data)
+    search = SYNC_PATTERN.search
 
     while True:
-        header_start = -1
-        try:
-            for i in range(len(buffer) - 1):
-                if buffer[i] in ("00", "80") and buffer[i + 1] == "55":
-                    header_start = i
-                    break
-        except IndexError:
+        match = search(data, pos)
+        if match is None:
             break
 
-        if header_start == -1:
+        header_start = match.start()
+        if header_start > pos:
+            chunks.append(('garbage', pos, header_start))
+        pos = header_start
+
+        if data_end - header_start < FRAME_LENGTH:
             break
+        pos = header_start + FRAME_LENGTH
+        chunks.append(('frame', header_start, pos))
+
+    return chunks, pos
 
-        if header_start > 0:
-            garbage = buffer[:header_start]
-            chunks.append(('garbage', garbage))
 
-        buffer = buffer[header_start:]
+def slice_chunks(data, chunks):
+    """
+    Yields (chunk_type, bytes) pairs for the offsets returned by parse_data_stream.
+    """
+    for chunk_type, start, end in chunks:
+        yield chunk_type, bytes(data[start:end])
+
+
+DEFAULT_FRAMER_CAPACITY = 64 * 1024
+
+
+class StreamFramer:
+    """
+    Incremental LIN framer for data that arrives in arbitrary pieces.
+
+    Bytes are copied into a fixed-capacity buffer that is never reallocated;
+    feed() returns only the chunks completed by the new data, and bytes of an
+    incomplete frame stay buffered for the next call. Each byte is scanned a
+    bounded number of times, so the cost of a call is proportional to its input.
+    """
+
+    def __init__(self, capacity=DEFAULT_FRAMER_CAPACITY):
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._capacity = capacity
+        self._start = 0
+        self._end = 0
+        # Everything before this offset is known to contain no sync
+        self._scanned = 0
+        self._text_carry = ""
+
+    def __len__(self):
+        return self._end - self._start
+
+    def reset(self):
+        self._start = 0
+        self._end = 0
+        self._scanned = 0
+        self._text_carry = ""
+
+    def flush(self):
+        """
+        Returns all buffered bytes as a single garbage chunk and empties the buffer.
+        """
+        chunks = []
+        if len(self):
+            chunks.append(('garbage', bytes(self._view[self._start:self._end])))
+        self.reset()
+        return chunks
+
+    def feed(self, data):
+        """
+        Appends raw bytes and returns the newly completed (chunk_type, bytes) chunks.
+        """
+        chunks = []
+        data = memoryview(data).cast('B')
+        while data:
+            if self._end == self._capacity:
+                self._compact(chunks)
+            count = min(len(data), self._capacity - self._end)
+            self._buffer[self._end:self._end + count] = data[:count]
+            self._end += count
+            data = data[count:]
+            self._scan(chunks)
+        return chunks
+
+    def feed_hex(self, text, is_spaced):
+        """
+        Converts a piece of hex text to bytes and feeds it. A token split across
+        two pieces is carried over until the rest of it arrives.
+        """
+        text = self._text_carry + text
+        if is_spaced:
+            match = _LAST_SEPARATOR.search(text)
+            if match is None:
+                self._text_carry = text
+                return []
+            self._text_carry = text[match.start() + 1:]
+            return self.feed(parse_hex_data(text[:match.start()], True))
+
+        cleaned = re.sub(r'[^0-9A-Fa-f]', '', text)
+        split = len(cleaned) - len(cleaned) % 2
+        self._text_carry = cleaned[split:]
+        return self.feed(bytes.fromhex(cleaned[:split]))
+
+    def finish_hex(self, is_spaced):
+        """
+        Feeds the token still carried over at the end of the hex text.
+        """
+        text, self._text_carry = self._text_carry, ""
+        return self.feed(parse_hex_data(text, is_spaced))
+
+    def _scan(self, chunks):
+        if SYNC_PATTERN.search(self._view, max(self._start, self._scanned - 1), self._end) is None:
+            self._scanned = self._end
+            return
+        spans, self._start = parse_data_stream(self._view[:self._end], self._start)
+        chunks.extend(slice_chunks(self._view, spans))
+        self._scanned = self._start
+
+    def _compact(self, chunks):
+        pending = self._end - self._start
+        if pending == self._capacity:
+            # A full buffer without a sync: drop all but the last byte as garbage,
+            # since that byte may still be the first half of a sync.
+            chunks.append(('garbage', bytes(self._view[self._start:self._end - 1])))
+            self._start = self._end - 1
+            pending = 1
+        self._buffer[:pending] = bytes(self._view[self._start:self._end])
+        self._scanned = max(0, self._scanned - self._start)
+        self._start = 0
+        self._end = pending
+
+
+_LAST_SEPARATOR = re.compile(r'\s\S*\Z')
+
+
+def build_frame_index(data, window=FILE_CHUNK_SIZE):
+    """
+    Returns an array with the start offset of every frame in a bytes-like buffer.
+    The buffer is scanned in windows, so no chunk list is kept for the whole file.
+    """
+    size = len(data)
+    offsets = array('Q' if size > 0xFFFFFFFF else 'I')
+    pos = 0
+    scanned = 0
+    window_end = 0
+    with memoryview(data) as view:
+        while window_end < size:
+            window_end = min(window_end + window, size)
+            if SYNC_PATTERN.search(view, max(pos, scanned - 1), window_end) is None:
+                scanned = window_end
+                continue
+            with view[:window_end] as window_view:
+                spans, pos = parse_data_stream(window_view, pos)
+            offsets.extend(start for chunk_type, start, _ in spans if chunk_type == 'frame')
+            scanned = pos
+    return offsets
+
+
+INDEX_SUFFIX = ".lidx"
+_INDEX_HEADER = struct.Struct("<8sQqc")
+_INDEX_MAGIC = b"LINIDX01"
+
+
+class BinaryLogReader:
+    """
+    Memory-mapped reader for binary LIN logs.
 
-        if len(buffer) >= FULL_FRAME_LENGTH:
-            frame = buffer[:FULL_FRAME_LENGTH]
-            chunks.append(('frame', frame))
-            buffer = buffer[FULL_FRAME_LENGTH:]
+    Keeps an index of frame start offsets that is saved next to the log and
+    reused while the log's size and modification time are unchanged, so reopening
+    a log skips the framing scan. Use it as a context manager, so the map and the
+    file are closed once the log has been read.
+    """
+
+    def __init__(self, file_name):
+        self.file_name = file_name
+        self.index_name = file_name + INDEX_SUFFIX
+        self._file = open(file_name, 'rb')
+        stat = os.fstat(self._file.fileno())
+        self._size = stat.st_size
+        self._mtime_ns = stat.st_mtime_ns
+        if self._size:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
         else:
-            break
+            self._data = b""
+
+        self.offsets = self._load_index()
+        if self.offsets is None:
+            self.offsets = build_frame_index(self._data)
+            self._save_index()
 
-    remainder_list = buffer
-    return chunks, remainder_list
+    def __len__(self):
+        return len(self.offsets)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def iter_chunk_batches(self, batch_size=4096):
+        """
+        Generator of (chunk_type, bytes) chunk lists in file order, rebuilt from
+        the index. Bytes between two frames are reported as a garbage chunk.
+        """
+        data = self._data
+        batch = []
+        prev_end = 0
+        for start in self.offsets:
+            if start > prev_end:
+                batch.append(('garbage', data[prev_end:start]))
+            prev_end = start + FRAME_LENGTH
+            batch.append(('frame', data[start:prev_end]))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _load_index(self):
+        try:
+            with open(self.index_name, 'rb') as f:
+                header = f.read(_INDEX_HEADER.size)
+                if len(header) != _INDEX_HEADER.size:
+                    return None
+                magic, size, mtime_ns, typecode = _INDEX_HEADER.unpack(header)
+                if (magic, size, mtime_ns) != (_INDEX_MAGIC, self._size, self._mtime_ns):
+                    return None
+                offsets = array(typecode.decode('ascii'))
+                payload = f.read()
+        except (OSError, ValueError):
+            return None
+        if len(payload) % offsets.itemsize:
+            return None
+        offsets.frombytes(payload)
+        if sys.byteorder == 'big':
+            offsets.byteswap()
+        return offsets
+
+    def _save_index(self):
+        offsets = self.offsets
+        if sys.byteorder == 'big':
+            offsets = array(offsets.typecode, offsets)
+            offsets.byteswap()
+        header = _INDEX_HEADER.pack(_INDEX_MAGIC, self._size, self._mtime_ns,
+                                    offsets.typecode.encode('ascii'))
+        try:
+            with open(self.index_name, 'wb') as f:
+                f.write(header)
+                offsets.tofile(f)
+        except OSError:
+            # The index is only a cache; a read-only location just means rescanning
+            pass
 
 
 def evaluate_protocol_version(versions, version_name_map):
@@ -0,0 +1,60 @@
+"""
+Navigation indexes of notable frames.
+
+LinDecoder fills one EventIndex per kind of event while it parses: frames
+that are invalid, trash bytes between frames, page 251 CRC mismatches and
+changes of the status signals in STATUS_EVENT_KEYS. Each index is a sorted
+array of frame numbers, so the next or previous event from any frame is one
+bisection away however long the session is.
+
+    index = decoder.events["invalid"]
+    index.next_after(slider.value())   -> frame number or None
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+# Status signals whose changes are indexed, each an event kind of its own
+STATUS_EVENT_KEYS = ("SeStatusVer", "SeStatusInit", "SeStatusOp", "EvIDStatus")
+
+# Event kinds and their labels, in the order the GUI lists them
+EVENT_KINDS = {
+    "invalid": "Invalid Frames",
+    "garbage": "Trash Bytes",
+    "crc": "CRC Mismatches",
+    **{key: f"{key} Changes" for key in STATUS_EVENT_KEYS},
+}
+
+
+class EventIndex:
+    """Sorted, distinct frame numbers of one kind of event."""
+    __slots__ = ("frames",)
+
+    def __init__(self):
+        self.frames = array('q')
+
+    def __len__(self):
+        return len(self.frames)
+
+    def clear(self):
+        del self.frames[:]
+
+    def add(self, frame):
+        frames = self.frames
+        if not frames or frames[-1] < frame:
+            frames.append(frame)
+            return
+        # Events are found in frame order almost always, so this is rare
+        index = bisect_left(frames, frame)
+        if index == len(frames) or frames[index] != frame:
+            frames.insert(index, frame)
+
+    def next_after(self, frame):
+        """Returns the first event frame after frame, or None."""
+        index = bisect_right(self.frames, frame)
+        return self.frames[index] if index < len(self.frames) else None
+
+    def previous_before(self, frame):
+        """Returns the last event frame before frame, or None."""
+        index = bisect_left(self.frames, frame)
+        return self.frames[index - 1] if index else None
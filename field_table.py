@@ -0,0 +1,109 @@
+"""
+Model/view tables for the panels that list fields next to the frame they
+were written in (the ID, data and J3072 tabs, EvInfo and SeInfo).
+
+Those panels used to rebuild an HTML <table> and hand it to a QTextEdit on
+every refresh, which made Qt parse and lay out the whole table again and
+lose the scroll position. A FieldTable instead shows the rows of a
+FieldTableModel: set_rows() compares the new rows with the shown ones and
+emits dataChanged only for the cells that differ, adding or removing rows
+at the end when the count changes, so the view repaints just those cells
+and keeps its scroll position.
+
+    table = FieldTable()
+    table.set_rows((("EvVIN: 1HGCM82633A004352", "(Frame: 12)"), ...))
+    table.set_message("No EvID stage available.")
+"""
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt5.QtWidgets import QTableView, QHeaderView, QAbstractItemView
+
+# Share of the width taken by the field column; the frame column gets the rest
+FIELD_COLUMN_SHARE = 0.7
+
+# Cell alignment by column
+COLUMN_ALIGNMENT = (Qt.AlignLeft | Qt.AlignVCenter, Qt.AlignRight | Qt.AlignVCenter)
+
+
+class FieldTableModel(QAbstractTableModel):
+    """Rows of (field text, frame text)."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = ()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole or role == Qt.ToolTipRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.TextAlignmentRole:
+            return COLUMN_ALIGNMENT[index.column()]
+        return None
+
+    def rows(self):
+        return self._rows
+
+    def set_rows(self, rows):
+        """Shows rows, signalling only the cells and rows that changed."""
+        rows = tuple(rows)
+        old_rows = self._rows
+        if rows == old_rows:
+            return
+        common = min(len(rows), len(old_rows))
+        if len(rows) < len(old_rows):
+            self.beginRemoveRows(QModelIndex(), common, len(old_rows) - 1)
+            self._rows = old_rows[:common]
+            self.endRemoveRows()
+        elif len(rows) > len(old_rows):
+            self.beginInsertRows(QModelIndex(), common, len(rows) - 1)
+            self._rows = old_rows + rows[common:]
+            self.endInsertRows()
+        self._rows = rows
+        for row in range(common):
+            for column, (new, old) in enumerate(zip(rows[row], old_rows[row])):
+                if new != old:
+                    index = self.index(row, column)
+                    self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.ToolTipRole])
+
+
+class FieldTable(QTableView):
+    """Read-only, headerless two-column view of a FieldTableModel."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setModel(FieldTableModel(self))
+        self.horizontalHeader().hide()
+        self.verticalHeader().hide()
+        self.horizontalHeader().setStretchLastSection(True)
+        # Rows grow to fit wrapped field text, like the table cells they replace
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.setShowGrid(False)
+        self.setWordWrap(True)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+    def rows(self):
+        return self.model().rows()
+
+    def set_rows(self, rows):
+        self.model().set_rows(rows)
+
+    def set_message(self, text):
+        """Shows text in place of the rows, e.g. when there is no data yet."""
+        self.model().set_rows(((text, ""),))
+
+    def clear(self):
+        self.model().set_rows(())
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.setColumnWidth(0, int(self.viewport().width() * FIELD_COLUMN_SHARE))
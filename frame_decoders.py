@@ -0,0 +1,1507 @@
+"""
+Frame decoders for the J3068 LIN frames.
+
+Each frame ID maps to one decoder in FRAME_DECODERS, so a frame is dispatched
+with one lookup instead of walking an if/elif chain. The multiplexed frames
+(EvID, SeID, EvJ3072, SeJ3072) dispatch a second time on their page byte into
+signal tables that are compiled once at import.
+
+A decoder is called as decoder(ctx, databytes), where ctx is normally a
+lin_decoder.LinDecoder:
+    ctx.display(text)            debug log line
+    ctx.add_event(kind)          add the frame to a navigation index
+    ctx.update_init/op/ver(k, v) store a decoded value
+    ctx.ver_data                 current version data, (value, frame) pairs
+    ctx.frame_number             number of the frame being decoded
+    ctx.page_buffers[name]       multi-page text fields being assembled
+    ctx.stage_bytes[name]        ID stage bytes covered by the page 251 CRC
+    ctx.cable_node_frames        list of raw Cable Node frames
+"""
+
+from data_processing import format_selected_version, determine_protocol_version, format_crc_status, \
+    format_Num_Prop_Pages, format_j3072_crc_status, crc_check
+from signal_values import Amps, Volts, Frequencies, IdStatus, J3072Status
+
+STATUSES = ["StatusVer", "StatusInit", "StatusOp"]
+STATUS_VALUES = ["Incomplete", "Complete", "Error", "N/A", "Deny_V", "Permit_V", "Error"]
+LINES = ["L1", "L2", "L3", "N"]
+
+FRAME_TYPE_NAMES = {
+    0: "SeVersionList",
+    1: "EvVersionList",
+    2: "SeStatus",
+    3: "EvStatus",
+    4: "EvPresentCurrents",
+    5: "SeNomVoltages",
+    6: "SeMaxCurrents",
+    7: "EvMaxVoltages",
+    8: "EvMinVoltages",
+    9: "EvMaxMinCurrents",
+    0x0A: "Cable Node",
+    0x0B: "SeInfoList",
+    0x0C: "EvInfoList",
+    0x0F: "EvID",
+    0x10: "SeID",
+    0x15: "EvModeCtrl",
+    0x16: "SeModeCtrl",
+    0x17: "EvJ3072",
+    0x18: "SeJ3072",
+    0x19: "SeTargets1"
+
+    # Add new frame types here for recent data
+}
+
+SE_CONNECTION_TYPES = {
+    0x00: "SAE J3068 AC (IEC 62196-2 Type 2) or GB/T 20234.2 socket-outlet",
+    0x01: "SAE J1772 (IEC 62196-2 Type 1) connector",
+    0x02: "SAE J3068 AC (IEC 62196-2 Type 2) connector",
+    0x03: "CCS1 connector",
+    0x04: "CCS2 (SAE J3068 DC) connector",
+    0x05: "SAF J3400 connector",
+    0x06: "GB/T 20234.2 connector",
+    0xFE: "Error",
+    0xFF: "N/A"
+}
+
+EV_CONNECTION_TYPES = {
+    0x00: "SAE J3068 AC (IEC 62196-2 Type 2 or GB/T 20234.2) socket-outlet",
+    0x01: "SAE J1772 (IEC 62196-2 Type 1) inlet",
+    0x02: "SAE J3068 AC (IEC 62196-2 Type 2) inlet",
+    0x03: "CCS1 connector",
+    0x04: "CCS2 (SAE J3068 DC/AC or DCa) inlet",
+    0x05: "SAE J3400 inlet",
+    0x06: "GB/T 20234.2 inlet",
+    0xFE: "Error",
+    0xFF: "N/A"
+}
+
+EV_GRID_CODE_STATUSES = {
+    0x0000: "not_supported", 0x0001: "Basic V2G settings A configured",
+    0x0002: "Basic V2X settings B configured", 0x0003: "UL 1741-SA defaults configured",
+    0x0004: "IEEE 1547-2018/UL 1741-SB defaults configured", 0x7FFE: "Error",
+    0x7FFF: "Unconfigured (start value)"
+}
+
+EV_INVERTER_STATES = {
+    0: "Disconnected/Off", 1: "Deep Sleep Offline", 2: "Deep Sleep Online",
+    3: "Light/Transparent Sleep", 4: "Active/On", 5: "In transition",
+    0x0E: "Error", 0x0F: "Not Available"
+}
+
+PWR_CTRL_MODES = {
+    0xFF: "Normal Charging", 0xB4: "CCL", 0xA3: "TC (P-)",
+    0x9A: "TGC (P±)", 0x8D: "TC+R (II & III)", 0x72: "TGC+R (I, II, III, & IV)",
+    0x39: "Autonomous/External Control", 0x17: "Local EPS Forming (V2L/H)",
+    0x00: "Processing", 0xE8: "RESERVED", 0xD1: "RESERVED", 0xC6: "RESERVED",
+    0x65: "RESERVED", 0x5C: "RESERVED", 0x2E: "RESERVED"
+}
+
+SE_GRID_CODE_REQUESTS = {
+    0x0001: "Request basic V2G settings A",
+    0x0002: "Request basic V2X settings B",
+    0x0003: "Request UL 1741-SA defaults",
+    0x0004: "Request IEEE 1547-2018/UL 1741-SB defaults",
+    0x7FFE: "Error",
+    0x7FFF: "No request, follow SunSpec"
+}
+
+SE_INVERTER_REQUESTS = {
+    0: "Disconnected/Off", 1: "Deep Sleep Offline",
+    2: "Deep Sleep Online", 3: "Light/Transparent Sleep",
+    4: "Active/On", 0x0F: "No Request"
+}
+
+SE_PWR_CTRL_UNITS = {
+    0: "% Max Watt", 1: "Current per phase", 2: "Total Watt",
+    8: "% Max Watt + % Max VAR", 9: "Current per phase + power factor",
+    10: "Current per phase + phase angle", 11: "Total Watt + Total VAR",
+    15: "N/A"
+}
+
+SE_PWR_CTRL_AUTHORIZATIONS = {
+    0: "Processing", 5: "Authorization to Discharge",
+    10: "Authorization to Form Local EPS", 15: "No authorization",
+    6: "RESERVED", 9: "RESERVED"
+}
+
+EV_PWR_CTRL_UNITS_AVAIL = (
+    (0x0001, "% Max Watt"),
+    (0x0002, "Current per phase"),
+    (0x0004, "Total Watt"),
+    (0x0100, "% Max Watt + % Max VAR"),
+    (0x0200, "Current per phase + PF"),
+    (0x0400, "Current per phase + Phase Angle"),
+    (0x0800, "Total Watt + Total VAR"),
+)
+
+EV_PWR_CTRL_MODES_AVAIL = (
+    (0x8000, "CCL"),
+    (0x4000, "TC (P-)"),
+    (0x2000, "TGC (P±)"),
+    (0x1000, "TC+R"),
+    (0x0800, "TGC+R"),
+    (0x0008, "Autonomous/External"),
+    (0x0002, "Local EPS Forming (V2L/H)"),
+)
+
+
+# -------------- helpers ---------------------
+def get_status_values(ctx, prefix, d1, store_to_ver_data=False):
+    temp = d1 >> 1
+    for i in range(1, 4):
+        if i < 3:
+            val_index = temp & 3
+        else:
+            val_index = (temp & 3) + 4
+        this_status = STATUS_VALUES[val_index]
+        ctx.display(f"    {prefix}{STATUSES[i - 1]}: {this_status}")
+        if store_to_ver_data:
+            ctx.update_ver(f"{prefix}{STATUSES[i - 1]}", this_status)
+        temp >>= 2
+
+
+def read_voltage_high_low(d_low, d_high):
+    return Volts((d_high << 8) | d_low)
+
+
+def bit_names(value, bits):
+    """Returns the names in bits, a tuple of (mask, name), whose mask is set in value."""
+    return [name for mask, name in bits if value & mask]
+
+
+def _assemble_and_update_field(ctx, page_buffer, field_name, expected_total_length):
+    """Helper to assemble, decode, and update a completed field."""
+    # Sort chunks by position to ensure correct order
+    sorted_chunks = sorted(page_buffer[field_name].items())
+
+    full_data_bytes = []
+    for _, chunk_data in sorted_chunks:
+        full_data_bytes.extend(chunk_data)
+
+    # Trim to the exact length
+    trimmed_bytes = full_data_bytes[:expected_total_length]
+
+    try:
+        byte_values = trimmed_bytes
+        ascii_string = bytes(byte_values).split(b'\x00')[0].decode('ascii', errors='replace').strip()
+        if not ascii_string:
+            ascii_string = "N/A"
+    except (TypeError, UnicodeDecodeError, IndexError, ValueError):
+        # Added TypeError
+        ascii_string = "Decode Error"
+
+    # Update the global data and clean up the buffer
+    ctx.update_op(field_name, ascii_string)
+    del page_buffer[field_name]
+
+
+def process_stage(ctx, page_buffer, field_name, string_position, data_bytes, field_total_length):
+    """
+    Buffers data for multi-page fields and processes them when the
+    expected total length is reached.
+    """
+    # Buffer the received data chunk
+    if field_name not in page_buffer:
+        page_buffer[field_name] = {}
+    page_buffer[field_name][string_position] = data_bytes
+
+    # Check if the field is complete using the provided total length
+    buffered_length = sum(len(chunk) for chunk in page_buffer[field_name].values())
+    if buffered_length >= field_total_length:
+        _assemble_and_update_field(ctx, page_buffer, field_name, field_total_length)
+
+
+# -------------- fixed frames ---------------------
+def decode_se_version_list(ctx, databytes):
+    ctx.display("  Interpretation: SeVersionList")
+
+    if len(databytes) >= 8:
+        se_sel_ver_str = format_selected_version(databytes[0])
+        ctx.update_ver("SeSelectedVersion_SeVersionList", se_sel_ver_str)
+        d1 = databytes[1]
+        page_number = databytes[2]
+        ctx.display(f"    SeSelectedVersion: {se_sel_ver_str}")
+        get_status_values(ctx, "Se", d1, store_to_ver_data=True)  # if you want them in ver_data
+        ctx.display(f"    SeVersionPageNumber: {page_number}")
+
+        for i in range(1, 6):
+            val = databytes[i + 2]
+            ctx.display(f"    SeSupportedVersion{i}: {val}")
+
+        ctx.update_ver("SeSelectedVersion", se_sel_ver_str)
+        ctx.update_ver("SeSelectedVersion", str(databytes[0]))
+        ctx.update_ver("SeVersionPageNumber", str(page_number))
+
+        for i in range(1, 6):
+            val = databytes[i + 2]
+            ctx.update_ver(f"SeSupportedVersion{i}", str(val))
+
+    else:
+        ctx.display("    Not enough data bytes to interpret")
+
+
+def decode_ev_version_list(ctx, databytes):
+    ctx.display("  Interpretation: EvVersionList")
+
+    if len(databytes) >= 8:
+        ev_sel_ver_str = format_selected_version(databytes[0])
+        ctx.update_ver("EvSelectedVersion_EvVersionList", ev_sel_ver_str)
+        d1 = databytes[1]  # Contains bits for EV statuses
+        page_number = databytes[2]
+        ev_response_error = "No Error" if (d1 & 1) == 0 else "Error"
+        ev_awake = "Awake" if ((d1 >> 7) & 1) == 1 else "Sleep_Req"
+
+        ctx.display(f"    EvSelectedVersion: {ev_sel_ver_str}")
+        ctx.display(f"    EvResponseError: {ev_response_error}")
+        get_status_values(ctx, "Ev", d1, store_to_ver_data=True)
+        ctx.display(f"    EvAwake: {ev_awake}")
+        ctx.display(f"    EvVersionPageNumber: {page_number}")
+
+        for i in range(1, 6):
+            val = databytes[i + 2]
+            ctx.display(f"    EvSupportedVersion{i}: {val}")
+
+        ctx.update_ver("EvSelectedVersion", ev_sel_ver_str)
+        ctx.update_ver("EvSelectedVersion", str(databytes[0]))
+        ctx.update_ver("EvVersionPageNumber", str(page_number))
+
+        for i in range(1, 6):
+            val = databytes[i + 2]
+            ctx.update_ver(f"EvSupportedVersion{i}", str(val))
+
+        ctx.update_op("EvResponseError", ev_response_error)
+        ctx.update_op("EvAwake", ev_awake)
+
+    else:
+        ctx.display("    Not enough data bytes to interpret")
+
+
+def decode_se_status(ctx, databytes):
+    ctx.display("  Interpretation: SeStatus")
+    if len(databytes) >= 6:
+        # Format only SeSelectedVersion
+        se_sel_ver_str = format_selected_version(databytes[0])
+        ctx.update_ver("SeSelectedVersion_SeVersionList", se_sel_ver_str)
+        ctx.display(f"    SeSelectedVersion: {se_sel_ver_str}")
+
+        get_status_values(ctx, "Se", databytes[1], store_to_ver_data=True)
+        # Retrieve updated ver_data to pass into determine_protocol_version
+        se_status_ver = ctx.ver_data.get("SeStatusVer", ("Unknown", 0))[0]
+        se_status_init = ctx.ver_data.get("SeStatusInit", ("Unknown", 0))[0]
+        se_status_op = ctx.ver_data.get("SeStatusOp", ("Unknown", 0))[0]
+
+        protocol_str = determine_protocol_version(
+            se_status_ver,
+            se_status_init,
+            se_status_op,
+            databytes[0]  # raw integer
+        )
+        ctx.display(f"    ProtocolVersion: {protocol_str}")
+        ctx.update_ver("ProtocolVersion", protocol_str)
+
+        # Format the amperage values
+        for i, line_name in enumerate(LINES):
+            amps = Amps(databytes[i + 2])
+            ctx.display(f"    SeAvailableCurrent{line_name}: {amps}")
+
+        # Update stored data
+        ctx.update_init("SeSelectedVersion", se_sel_ver_str)
+        for i, line_name in enumerate(LINES):
+            amps = Amps(databytes[i + 2])
+            ctx.update_init(f"SeAvailableCurrent_{line_name}", amps)
+
+        ctx.update_op("SeOpSelectedVersion", se_sel_ver_str)
+        for i, line_name in enumerate(LINES):
+            amps = Amps(databytes[i + 2])
+            ctx.update_op(f"SeOpAvailableCurrent_{line_name}", amps)
+    else:
+        ctx.display("    Not enough data bytes to interpret")
+
+
+def decode_ev_status(ctx, databytes):
+    ctx.display("  Interpretation: EvStatus")
+    if len(databytes) >= 6:
+        ev_sel_ver_str = format_selected_version(databytes[0])
+        ctx.update_ver("EvSelectedVersion_EvVersionList", ev_sel_ver_str)
+        ctx.display(f"    EvSelectedVersion: {ev_sel_ver_str}")
+
+        ev_response_error = "No Error" if (databytes[1] & 1) == 0 else "Error"
+        ctx.display(f"    EvResponseError: {ev_response_error}")
+        get_status_values(ctx, "Ev", databytes[1], store_to_ver_data=True)
+        ev_awake = "Awake" if ((databytes[1] >> 7) & 1) == 1 else "Sleep_Req"
+        ctx.display(f"    EvAwake: {ev_awake}")
+        ctx.update_ver("EvAwake", ev_awake)
+
+        # EV Present Current Dropdown Data
+        ctx.update_op("EvResponseError", ev_response_error)
+        ctx.update_op("EvAwake", ev_awake)
+
+        for i, line_name in enumerate(LINES):
+            amps = Amps(databytes[i + 2])
+            ctx.display(f"\t   &nbsp; &nbsp; EvRequestedCurrent{line_name}: {amps}")
+
+        ctx.update_init("EvSelectedVersion", ev_sel_ver_str)
+        for i, line_name in enumerate(LINES):
+            amps = Amps(databytes[i + 2])
+            ctx.update_init(f"EvRequestedCurrent_{line_name}", amps)
+
+        ctx.update_op("EvOpSelectedVersion", ev_sel_ver_str)
+        for i, line_name in enumerate(LINES):
+            amps = Amps(databytes[i + 2])
+            ctx.update_op(f"EvOpRequestedCurrent_{line_name}", amps)
+    else:
+        ctx.display("    Not enough data bytes to interpret")
+
+
+def decode_ev_present_currents(ctx, databytes):
+    ctx.display("  Interpretation: EvPresentCurrents")
+    if len(databytes) >= 5:
+        ev_sel_ver_str = format_selected_version(databytes[0])
+        ctx.display(f"    EvSelectedVersion: {ev_sel_ver_str}")
+        for i, line_name in enumerate(LINES):
+            amps = Amps(databytes[i + 1])
+            ctx.display(f"   &nbsp; &nbsp; EvPresentCurrent{line_name}: {amps}")
+
+        ctx.update_op("EvOpSelectedVersion", ev_sel_ver_str)
+        for i, line_name in enumerate(LINES):
+            amps = Amps(databytes[i + 1])
+            ctx.update_op(f"EvOpPresentCurrent_{line_name}", amps)
+    else:
+        ctx.display("    Not enough data bytes to interpret")
+
+
+def decode_se_nom_voltages(ctx, databytes):
+    ctx.display("  Interpretation: SeNomVoltages")
+    if len(databytes) >= 6:
+        se_sel_ver_str = format_selected_version(databytes[0])
+        ctx.update_ver("SeSelectedVersion_SeVersionList", se_sel_ver_str)
+        ctx.display(f"    SeSelectedVersion: {se_sel_ver_str}")
+
+        volt_l1n = read_voltage_high_low(databytes[1], databytes[2])
+        volt_ll = read_voltage_high_low(databytes[3], databytes[4])
+        freq_index = databytes[5]
+        freq = Frequencies(freq_index)
+
+        ctx.display(f"    SeNomVoltageL1N: {volt_l1n}")
+        ctx.display(f"    SeNomVoltageLL: {volt_ll}")
+        ctx.display(f"    SeFrequency: {freq} (raw = {freq_index})")
+
+        ctx.update_init("SeSelectedVersion", se_sel_ver_str)
+        ctx.update_init("SeNomVoltageL1N", volt_l1n)
+        ctx.update_init("SeNomVoltageLL", volt_ll)
+        ctx.update_init("SeFrequency", freq)
+    else:
+        ctx.display("    Not enough data bytes to interpret")
+
+
+def decode_se_max_currents(ctx, databytes):
+    ctx.display("  Interpretation: SeMaxCurrents")
+    if len(databytes) >= 6:
+        se_sel_ver_str = format_selected_version(databytes[0])
+        ctx.update_ver("SeSelectedVersion_SeVersionList", se_sel_ver_str)
+        ctx.display(f"    SeMaXCurrents (SelectedVersion): {se_sel_ver_str}")
+
+        for i, line_name in enumerate(LINES):
+            amps = Amps(databytes[i + 1])
+            ctx.display(f"    SeMaXCurrent{line_name}: {amps}")
+            ctx.update_init(f"SeMaxCurrent_{line_name}", amps)
+
+
+        se_conn_type_val = databytes[5]
+        se_conn_type_str = SE_CONNECTION_TYPES.get(
+            se_conn_type_val,
+            f"Reserved (0x{se_conn_type_val:02X})"
+        )
+
+        ctx.display(f"    SeConnectionType: {se_conn_type_str}")
+        ctx.update_op("SeConnectionType", se_conn_type_str)
+
+    else:
+        ctx.display("    Not enough data bytes to interpret")
+
+
+def decode_ev_max_voltages(ctx, databytes):
+    ctx.display("  Interpretation: EvMaxVoltages")
+    if len(databytes) >= 6:
+        ev_sel_ver_str = format_selected_version(databytes[0])
+        ctx.update_ver("EvSelectedVersion_EvVersionList", ev_sel_ver_str)
+        ctx.display(f"    EvSelectedVersion: {ev_sel_ver_str}")
+
+        volt_l1n = read_voltage_high_low(databytes[1], databytes[2])
+        volt_ll = read_voltage_high_low(databytes[3], databytes[4])
+        freq_index = databytes[5]
+        freq = Frequencies(freq_index)
+
+        ctx.display(f"    EvMaxVoltageL1N: {volt_l1n}")
+        ctx.display(f"    EvMaxVoltageLL: {volt_ll}")
+        ctx.display(f"    EvFrequencies: {freq} (raw = {freq_index})")
+
+        ctx.update_init("EvSelectedVersion", ev_sel_ver_str)
+        ctx.update_init("EvMaxVoltageL1N", volt_l1n)
+        ctx.update_init("EvMaxVoltageLL", volt_ll)
+        ctx.update_init("EvFrequencies", freq)
+    else:
+        ctx.display("    Not enough data bytes to interpret")
+
+
+def decode_ev_min_voltages(ctx, databytes):
+    ctx.display("  Interpretation: EvMinVoltages")
+
+    if len(databytes) >= 6:
+        ev_sel_ver_str = format_selected_version(databytes[0])
+        ctx.display(f"    EvSelectedVersion: {ev_sel_ver_str}")
+
+        volt_l1n = read_voltage_high_low(databytes[1], databytes[2])
+        volt_ll = read_voltage_high_low(databytes[3], databytes[4])
+
+        ctx.display(f"    EvMinVoltageL1N: {volt_l1n}")
+        ctx.display(f"    EvMinVoltageLL: {volt_ll}")
+
+        ctx.update_init("EvSelectedVersion", ev_sel_ver_str)
+        ctx.update_init("EvMinVoltageL1N", volt_l1n)
+        ctx.update_init("EvMinVoltageLL", volt_ll)
+
+        # EvConnectionType (byte 5)
+
+        ev_conn_type_val = databytes[5]
+        ev_conn_type_str = EV_CONNECTION_TYPES.get(
+            ev_conn_type_val,
+            f"Reserved (0x{ev_conn_type_val:02X})"
+        )
+
+        # Display and store EvConnectionType
+        ctx.display(f"    EvConnectionType: {ev_conn_type_str}")
+        ctx.update_op("EvConnectionType", ev_conn_type_str)
+
+    else:
+        ctx.display("    Not enough data bytes to interpret")
+
+
+def decode_ev_max_min_currents(ctx, databytes):
+    ctx.display("  Interpretation: EvMaxMinCurrents")
+    if len(databytes) >= 8:
+        ev_sel_ver_str = format_selected_version(databytes[0])
+        ctx.update_ver("EvSelectedVersion_EvVersionList", ev_sel_ver_str)
+        ctx.display(f"    EvSelectedVersion: {ev_sel_ver_str}")
+        for i, line_name in enumerate(LINES):
+            amps = Amps(databytes[i + 1])
+            ctx.display(f"    EvMaxCurrent{line_name}: {amps}")
+            ctx.update_init(f"EvMaxCurrent_{line_name}", amps)
+        for i, line_name in enumerate(LINES[:3]):
+            amps = Amps(databytes[i + 5])
+            ctx.display(f"    EvMinCurrent{line_name}: {amps}")
+            ctx.update_init(f"EvMinCurrent_{line_name}", amps)
+    else:
+        ctx.display("    Not enough data bytes to interpret")
+
+
+def decode_cable_node(ctx, databytes):
+    ctx.display("  Interpretation: Cable_Node.")
+    ctx.cable_node_frames.append({
+        "frame": ctx.frame_number,  # current frame number
+        "data": databytes  # list of data bytes (as integers)
+    })
+
+    def fmt_val(val):
+        return "N/A" if val == 0xFF else str(val)
+
+    frame_num = ctx.frame_number
+    if databytes[0] == 0x01:
+        version = 1
+    elif databytes[0] == 0x02:
+        version = 2
+    else:
+        version = f"Unknown ({databytes[0]:02X})"
+    ctx.display(f"    CaVersion: {fmt_val(databytes[0])}")
+    if version == 1:
+        response_error = databytes[1] & 0x01
+        ctx.display(f"    CaResponseError: {fmt_val(response_error)}")
+        max_voltage = (databytes[3] << 8) | databytes[2]
+        voltage_str = "N/A" if max_voltage == 0xFFFF else f"{max_voltage / 10.0:.1f}"
+        ctx.display(f"    CaMaxVoltage: {voltage_str}")
+        ctx.display(f"    CaMaxCurrentL1: {fmt_val(databytes[4])}")
+        ctx.display(f"    CaMaxCurrentL2: {fmt_val(databytes[5])}")
+        ctx.display(f"    CaMaxCurrentL3: {fmt_val(databytes[6])}")
+        ctx.display(f"    CaMaxCurrentN: {fmt_val(databytes[7])}")
+
+    elif version == 2:
+        response_error = databytes[1] & 0x01
+        connector_type = databytes[1] >> 1
+        ctx.display(f"    CaResponseError: {fmt_val(response_error)}")
+        ctx.display(f"    CaConnectorType: {fmt_val(connector_type)}")
+        insl_class_l1n = databytes[2] & 0x0F
+        insl_class_ll = databytes[2] >> 4
+        ctx.display(f"    CaInslClassL1N: {fmt_val(insl_class_l1n)}")
+        ctx.display(f"    CaInslClassLL: {fmt_val(insl_class_ll)}")
+        ca_prest_l1 = databytes[3] & 0x01
+        ca_prest_l2 = (databytes[3] >> 1) & 0x01
+        ca_prest_l3 = (databytes[3] >> 2) & 0x01
+        ca_prest_n = (databytes[3] >> 3) & 0x01
+        ctx.display(f"    CaPrestL1: {fmt_val(ca_prest_l1)}")
+        ctx.display(f"    CaPrestL2: {fmt_val(ca_prest_l2)}")
+        ctx.display(f"    CaPrestL3: {fmt_val(ca_prest_l3)}")
+        ctx.display(f"    CaPrestN: {fmt_val(ca_prest_n)}")
+        ctx.display(f"    CaMaxCurrentL: {fmt_val(databytes[4])}")
+        ctx.display(f"    CaMaxCurrentN: {fmt_val(databytes[5])}")
+        ctx.display(f"    CaPlugTemp: {fmt_val(databytes[6])}")
+        ctx.display(f"    CaConnectorTemp: {fmt_val(databytes[7])}")
+
+    else:
+        for i, b in enumerate(databytes):
+            ctx.display(f"    Byte {i}: {fmt_val(b)} (Frame: {frame_num})")
+
+
+def decode_se_info_list(ctx, databytes):
+    ctx.display("  Interpretation: SeInfoList")
+
+    if len(databytes) >= 8:
+        se_sel_ver_str = format_selected_version(databytes[0])
+        ctx.update_ver("SeSelectedVersion_SeVersionList", se_sel_ver_str)
+        ctx.display(f"    SeSelectedVersion: {se_sel_ver_str}")
+        page_num = databytes[1]
+        ctx.display(f"    SeInfoPageNumber: {page_num}")
+        ctx.update_init("SeInfoPageNumber", str(page_num))  # store in current_init_data
+
+        for i in range(1, 7):
+            code_val = databytes[i + 1]
+            hex_str = f"{code_val:02X}"
+            ctx.display(f"    SeInfoEntry{i}: {hex_str}")
+            ctx.update_init(f"SeInfoEntry{i}", hex_str)
+
+        ctx.update_init("SeSelectedVersion", se_sel_ver_str)
+
+    else:
+        ctx.display("    Not enough data bytes to interpret")
+
+
+def decode_ev_info_list(ctx, databytes):
+    ctx.display("  Interpretation: EvInfoList")
+
+    if len(databytes) >= 8:
+        ev_sel_ver_str = format_selected_version(databytes[0])
+        ctx.update_ver("EvSelectedVersion_EvVersionList", ev_sel_ver_str)
+        ctx.display(f"    EvSelectedVersion: {ev_sel_ver_str}")
+        page_num = databytes[1]
+        ctx.display(f"    EvInfoPageNumber: {page_num}")
+        ctx.update_init("EvInfoPageNumber", str(page_num))
+
+        for i in range(1, 7):
+            code_val = databytes[i + 1]
+            hex_str = f"{code_val:02X}"
+            ctx.display(f"    EvInfoEntry{i}: {hex_str}")
+            ctx.update_init(f"EvInfoEntry{i}", hex_str)
+        ctx.update_init("EvSelectedVersion", ev_sel_ver_str)
+
+    else:
+        ctx.display("    Not enough data bytes to interpret")
+
+
+def decode_ev_mode_ctrl(ctx, databytes):
+    ctx.display("  Interpretation: EvModeCtrl")
+    if len(databytes) >= 8:
+        # --- EvGridCodeStatus & EvGridCodeStatusMod (Bytes 0-1) ---
+        raw_grid_code = (databytes[1] << 8) | databytes[0]
+        grid_code_mod_val = (raw_grid_code >> 15) & 0x01
+        grid_code_status_val = raw_grid_code & 0x7FFF
+
+        grid_code_mod_str = "Modified" if grid_code_mod_val == 0 else "Unmodified/Not Configured"
+
+        grid_code_status_str = EV_GRID_CODE_STATUSES.get(grid_code_status_val, f"Manufacturer-defined ({grid_code_status_val:04X})")
+
+        ctx.display(f"    EvGridCodeStatus: {grid_code_status_str}")
+        ctx.display(f"    EvGridCodeStatusMod: {grid_code_mod_str}")
+        ctx.update_op("EvGridCodeStatus", grid_code_status_str)
+        ctx.update_op("EvGridCodeStatusMod", grid_code_mod_str)
+
+        # --- EvInverterState (Byte 2) ---
+        inverter_state_val = databytes[2] & 0x0F
+        inverter_state_str = EV_INVERTER_STATES.get(inverter_state_val, "Reserved")
+        ctx.display(f"    EvInverterState: {inverter_state_str}")
+        ctx.update_op("EvInverterState", inverter_state_str)
+
+        # --- EvPwrCtrlModeAck (Byte 3) ---
+        ack_val = databytes[3]
+        ack_str = PWR_CTRL_MODES.get(ack_val, "Invalid/Reserved")
+        ctx.display(f"    EvPwrCtrlModeAck: {ack_str}")
+        ctx.update_op("EvPwrCtrlModeAck", ack_str)
+
+        # --- EvPwrCtrlUnitsAvail (Bytes 4-5) ---
+        units_val = (databytes[5] << 8) | databytes[4]
+        units_list = bit_names(units_val, EV_PWR_CTRL_UNITS_AVAIL)
+        units_str = ", ".join(units_list) if units_list else "None"
+        ctx.display(f"    EvPwrCtrlUnitsAvail: {units_str}")
+        ctx.update_op("EvPwrCtrlUnitsAvail", units_str)
+
+        # --- EvPwrCtrlModesAvail (Bytes 6-7) ---
+        modes_val = (databytes[7] << 8) | databytes[6]
+        modes_list = bit_names(modes_val, EV_PWR_CTRL_MODES_AVAIL)
+        modes_str = ", ".join(modes_list) if modes_list else "None (Normal Charging Only)"
+        ctx.display(f"    EvPwrCtrlModesAvail: {modes_str}")
+        ctx.update_op("EvPwrCtrlModesAvail", modes_str)
+    else:
+        ctx.display("    Not enough data bytes to interpret")
+
+
+def decode_se_mode_ctrl(ctx, databytes):
+    ctx.display("  Interpretation: SeModeCtrl")
+    if len(databytes) >= 8:
+        # --- SeGridCodeRequest (Bytes 0-1) ---
+        raw_grid_req = (databytes[1] << 8) | databytes[0]
+        grid_req_val = (raw_grid_req >> 2) & 0x3FFF # Extract 14 bits
+
+        grid_req_str = SE_GRID_CODE_REQUESTS.get(grid_req_val, f"Manufacturer-defined ({grid_req_val:04X})")
+        ctx.display(f"    SeGridCodeRequest: {grid_req_str}")
+        ctx.update_op("SeGridCodeRequest", grid_req_str)
+
+        # --- SeInverterRequest (Byte 2) ---
+        inverter_req_val = databytes[2] & 0x0F
+        inverter_req_str = SE_INVERTER_REQUESTS.get(inverter_req_val, "Reserved")
+        ctx.display(f"    SeInverterRequest: {inverter_req_str}")
+        ctx.update_op("SeInverterRequest", inverter_req_str)
+
+        # --- SePwrCtrlMode (Byte 3) ---
+        mode_val = databytes[3]
+        mode_str = PWR_CTRL_MODES.get(mode_val, "Invalid")
+        ctx.display(f"    SePwrCtrlMode: {mode_str}")
+        ctx.update_op("SePwrCtrlMode", mode_str)
+
+        # --- SePwrCtrlUnits & SePwrCtrlAuth (Byte 4) ---
+        units_val = databytes[4] & 0x0F
+        auth_val = (databytes[4] >> 4) & 0x0F
+
+        units_str = SE_PWR_CTRL_UNITS.get(units_val, "Reserved")
+        ctx.display(f"    SePwrCtrlUnits: {units_str}")
+        ctx.update_op("SePwrCtrlUnits", units_str)
+
+        auth_str = SE_PWR_CTRL_AUTHORIZATIONS.get(auth_val, "Invalid")
+        ctx.display(f"    SePwrCtrlAuth: {auth_str}")
+        ctx.update_op("SePwrCtrlAuth", auth_str)
+
+        # --- SeTimeStamp (Byte 7) ---
+        timestamp_val = databytes[7]
+        timestamp_str = "N/A" if timestamp_val == 0xFF else f"{timestamp_val} (Time base determined by SE)"
+        ctx.display(f"    SeTimeStamp: {timestamp_str}")
+        ctx.update_op("SeTimeStamp", timestamp_str)
+
+    else:
+        ctx.display("    Not enough data bytes to interpret")
+
+
+def decode_se_targets1(ctx, databytes):
+    ctx.display("  Interpretation: SeTargets1")
+    if len(databytes) >= 8:
+        element_a = (databytes[1] << 8) | databytes[0]
+        element_b = (databytes[3] << 8) | databytes[2]
+        element_c = (databytes[5] << 8) | databytes[4]
+        element_d = (databytes[7] << 8) | databytes[6]
+
+        ctx.update_op("SeTargets1ElementA", element_a)
+        ctx.update_op("SeTargets1ElementB", element_b)
+        ctx.update_op("SeTargets1ElementC", element_c)
+        ctx.update_op("SeTargets1ElementD", element_d)
+
+        ctx.update_op("SeTargets1_SelectedVersion", format_selected_version(databytes[0]))
+
+        ctx.display(f"    SeTargets1ElementA: 0x{element_a:04X}")
+        ctx.display(f"    SeTargets1ElementB: 0x{element_b:04X}")
+        ctx.display(f"    SeTargets1ElementC: 0x{element_c:04X}")
+        ctx.display(f"    SeTargets1ElementD: 0x{element_d:04X}")
+    else:
+        ctx.display("    Not enough data bytes to interpret")
+
+
+# -------------- multiplexed frames ---------------------
+class Field:
+    """
+    A numeric signal of a multiplexed page, packed little-endian from
+    `length` data bytes starting at `byte`, then shifted and masked.
+    Raw values at or above the na, error and reserved sentinels are shown as
+    such; anything else is shown as fmt.format(raw * scale + offset).
+    """
+    __slots__ = ("name", "byte", "length", "shift", "mask", "na", "error", "reserved",
+                 "scale", "offset", "fmt", "page_line", "_indices")
+
+    def __init__(self, name, byte, length=1, shift=0, mask=None, na=None, error=None,
+                 reserved=None, scale=1, offset=0, fmt="{}"):
+        self.name = name
+        self.byte = byte
+        self.length = length
+        self.shift = shift
+        self.mask = (1 << (8 * length)) - 1 if mask is None else mask
+        self.na = na
+        self.error = error
+        self.reserved = reserved
+        self.scale = scale
+        self.offset = offset
+        self.fmt = fmt
+        self.page_line = None
+        # Most significant byte first
+        self._indices = tuple(range(byte + length - 1, byte - 1, -1))
+
+    def bind(self, page):
+        self.page_line = f"    {self.name} Page: {page}"
+        return self
+
+    def raw(self, databytes):
+        value = 0
+        for index in self._indices:
+            value = (value << 8) | databytes[index]
+        return (value >> self.shift) & self.mask
+
+    def decode(self, databytes):
+        raw = self.raw(databytes)
+        if self.na is not None and raw >= self.na:
+            return "N/A"
+        if self.error is not None and raw >= self.error:
+            return "Error"
+        if self.reserved is not None and raw >= self.reserved:
+            return f"Reserved 0x{raw:02X}"
+        return self.fmt.format(raw * self.scale + self.offset)
+
+    def apply(self, ctx, databytes, page_buffer):
+        ctx.display(self.page_line)
+        ctx.update_op(self.name, self.decode(databytes))
+
+
+class EnumField(Field):
+    """A Field whose raw values are looked up in states; unlisted values are Reserved."""
+    __slots__ = ("states",)
+
+    def __init__(self, name, byte, length=1, shift=0, mask=None, states=None):
+        super().__init__(name, byte, length, shift, mask)
+        self.states = states or {}
+
+    def decode(self, databytes):
+        raw = self.raw(databytes)
+        state = self.states.get(raw)
+        if state is None:
+            return f"Reserved 0x{raw:02X}"
+        return state
+
+
+class TextChunk:
+    """
+    `size` bytes of a text field that spans several pages, starting at data
+    byte 1 and placed at `position` in a string of `total_length` bytes.
+    """
+    __slots__ = ("name", "position", "size", "total_length", "page_line")
+
+    def __init__(self, name, position, size, total_length):
+        self.name = name
+        self.position = position
+        self.size = size
+        self.total_length = total_length
+        self.page_line = None
+
+    def bind(self, page):
+        self.page_line = f"    {self.name} Page: {page} (Buffering Data)"
+        return self
+
+    def apply(self, ctx, databytes, page_buffer):
+        ctx.display(self.page_line)
+        process_stage(ctx, page_buffer, self.name, self.position, databytes[1:1 + self.size], self.total_length)
+
+
+# EvID pages: Table 4 (ID stage) and Table 5 (data stage)
+EV_ID_PAGES = {
+    1: (
+        TextChunk("EvVIN", 0, 7, 17),
+    ),
+    2: (
+        TextChunk("EvVIN", 7, 7, 17),
+    ),
+    3: (
+        TextChunk("EvVIN", 14, 3, 17),
+    ),
+    4: (
+        TextChunk("EvEMAID", 0, 7, 18),
+    ),
+    5: (
+        TextChunk("EvEMAID", 7, 7, 18),
+    ),
+    6: (
+        TextChunk("EvEMAID", 14, 4, 18),
+    ),
+    7: (
+        TextChunk("EvEVCCID", 0, 7, 70),
+    ),
+    8: (
+        TextChunk("EvEVCCID", 7, 7, 70),
+    ),
+    9: (
+        TextChunk("EvEVCCID", 14, 7, 70),
+    ),
+    10: (
+        TextChunk("EvEVCCID", 21, 7, 70),
+    ),
+    11: (
+        TextChunk("EvEVCCID", 28, 7, 70),
+    ),
+    12: (
+        TextChunk("EvEVCCID", 35, 7, 70),
+    ),
+    13: (
+        TextChunk("EvEVCCID", 42, 7, 70),
+    ),
+    14: (
+        TextChunk("EvEVCCID", 49, 7, 70),
+    ),
+    15: (
+        TextChunk("EvEVCCID", 56, 7, 70),
+    ),
+    16: (
+        TextChunk("EvEVCCID", 63, 7, 70),
+    ),
+    17: (
+        TextChunk("EvSerialNum", 0, 7, 42),
+    ),
+    18: (
+        TextChunk("EvSerialNum", 7, 7, 42),
+    ),
+    19: (
+        TextChunk("EvSerialNum", 14, 7, 42),
+    ),
+    20: (
+        TextChunk("EvSerialNum", 21, 7, 42),
+    ),
+    21: (
+        TextChunk("EvSerialNum", 28, 7, 42),
+    ),
+    22: (
+        TextChunk("EvSerialNum", 35, 7, 42),
+    ),
+    23: (
+        TextChunk("EvDriverID", 0, 7, 21),
+    ),
+    24: (
+        TextChunk("EvDriverID", 7, 7, 21),
+    ),
+    25: (
+        TextChunk("EvDriverID", 14, 7, 21),
+    ),
+    26: (
+        TextChunk("EvVehicleName", 0, 7, 21),
+    ),
+    27: (
+        TextChunk("EvVehicleName", 7, 7, 21),
+    ),
+    28: (
+        TextChunk("EvVehicleName", 14, 7, 21),
+    ),
+    29: (
+        TextChunk("EvFirmwareRevision", 0, 7, 28),
+    ),
+    30: (
+        TextChunk("EvFirmwareRevision", 7, 7, 28),
+    ),
+    31: (
+        TextChunk("EvFirmwareRevision", 14, 7, 28),
+    ),
+    32: (
+        TextChunk("EvFirmwareRevision", 21, 7, 28),
+    ),
+    33: (
+        TextChunk("EvManufacturer", 0, 7, 42),
+    ),
+    34: (
+        TextChunk("EvManufacturer", 7, 7, 42),
+    ),
+    35: (
+        TextChunk("EvManufacturer", 14, 7, 42),
+    ),
+    36: (
+        TextChunk("EvManufacturer", 21, 7, 42),
+    ),
+    37: (
+        TextChunk("EvManufacturer", 28, 7, 42),
+    ),
+    38: (
+        TextChunk("EvManufacturer", 35, 7, 42),
+    ),
+    39: (
+        Field("EvPropDataIdent", 1, na=0xFF, error=0xFF, reserved=0xFB, fmt="0x{:02X} "),
+        Field("EvPropDataRev", 2, na=0xFF, error=0xFF, reserved=0xFB, fmt="0x{:02X} "),
+        TextChunk("EvPropDataSymb", 0, 5, 5),
+    ),
+    97: (
+        Field("EvOdometer", 1, 4, na=0xFF000000, error=0xFF000000, reserved=0xFB000000, scale=0.125, fmt="{:.3f} km"),
+        EnumField("EvStatusInletLatch", 5, mask=0x03, states={
+            0x00: "released",
+            0x01: "engaged",
+            0x02: "Error",
+            0x03: "N/A",
+        }),
+        EnumField("EvStatusInletOverride", 5, shift=2, mask=0x03, states={
+            0x00: "not_active",
+            0x01: "active",
+            0x02: "Error",
+            0x03: "N/A",
+        }),
+        EnumField("EvStatusInletLock", 5, shift=4, mask=0x07, states={
+            0x00: "Unlocked",
+            0x01: "Locked",
+            0x02: "In_transition",
+            0x05: "No_lock",
+            0x06: "Error",
+            0x07: "N/A",
+        }),
+    ),
+    98: (
+        Field("EvNumberJ2012Dtcs", 1, na=0xFF, error=0xFF, reserved=0xFB, fmt="{} count"),
+        EnumField("EvJ2012DtcStatus", 7, mask=0x01, states={
+            0x00: "previously_active",
+            0x01: "active",
+        }),
+        Field("EvJ2012DtcCount", 7, shift=1, mask=0x7F, na=0x7F, error=0x7F, fmt="{} count"),
+    ),
+    99: (
+        Field("EvHVESSDishargeCapacity", 1, 3, na=0xFF0000, error=0xFF0000, reserved=0xFB0000, scale=0.001, fmt="{:.3f} kWh"),
+        Field("EvHVESSChargeCapacity", 4, 3, na=0xFF0000, error=0xFF0000, reserved=0xFB0000, scale=0.001, fmt="{:.3f} kWh"),
+    ),
+    100: (
+        Field("EvEnergyForDeparture", 1, 3, na=0xFF0000, error=0xFF0000, reserved=0xFB0000, scale=0.001, fmt="{:.3f} kWh"),
+        Field("EvTimeToDeparture", 4, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="{} min"),
+    ),
+    101: (
+        Field("EvHVESSRange", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="{} km"),
+        Field("EvFuelRange", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="{} km"),
+        Field("EvEVTimeToEnergyForDept", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="{} min"),
+    ),
+    102: (
+        Field("EvDurMin", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=10, fmt="{} s"),
+        Field("EvChaDurMax", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=10, fmt="{} s"),
+        Field("EvDschDurMax", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=10, fmt="{} s"),
+    ),
+    103: (
+        Field("EvTimeReqNum", 1, na=0xFF, error=0xFF, reserved=0xFB, fmt="0x{:02X} "),
+        Field("EvEVTimeToRange", 2, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="{} min"),
+        Field("EvEVTimeToEnergy", 4, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="{} min"),
+    ),
+    104: (
+        Field("EvHVESSVoltage", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.05, fmt="{:.3f} "),
+        Field("EvHVESSCurrent", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.05, offset=-1600, fmt="{:.3f} "),
+        Field("EvHVESSHealth", 5, na=0xFF, error=0xFF, reserved=0xFB, scale=0.4, fmt="{:.3f} %"),
+        Field("EvHVESSUserSOC", 6, na=0xFF, error=0xFF, reserved=0xFB, scale=0.4, fmt="{:.3f} %"),
+    ),
+    105: (
+        Field("EvACActivePower", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=16, offset=-500000, fmt="{} W"),
+        Field("EvACReactivePower", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=16, offset=-500000, fmt="{} VA"),
+        Field("EvACFrequency", 5, na=0xFF, error=0xFF, reserved=0xFB, scale=0.1, offset=42.5, fmt="{:.3f} Hz"),
+    ),
+    106: (
+        Field("EvL1NVolts", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.05, fmt="{:.3f} Volts"),
+        Field("EvL2NVolts", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.05, fmt="{:.3f} Volts"),
+        Field("EvL3NVolts", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.05, fmt="{:.3f} Volts"),
+    ),
+    107: (
+        Field("EvAmbientTemp", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.03125, offset=-273, fmt="{:.3f} C"),
+        Field("EvCabinTemp", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.03125, offset=-273, fmt="{:.3f} C"),
+    ),
+    108: (
+        Field("EvHVESSCellTemp", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.03125, offset=-273, fmt="{:.3f} C"),
+        Field("EvMaxHVESSTemp", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.03125, offset=-273, fmt="{:.3f} C"),
+        Field("EvMinHVESSTemp", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.03125, offset=-273, fmt="{:.3f} C"),
+        Field("EvHVESSElecTemp", 7, na=0xFF, error=0xFF, reserved=0xFB, offset=-40, fmt="{} C"),
+    ),
+    109: (
+        Field("EvMaxHVESSCellVolt", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.001, fmt="{:.3f} V"),
+        Field("EvMinHVESSCellVolt", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.001, fmt="{:.3f} V"),
+        Field("EvNumHVESSCellBalancing", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="{} "),
+        EnumField("EvStatusCellVoltDiff", 7, mask=0x0F, states={
+            0x00: "within_acceptable_limits",
+            0x01: "can_be_corrected",
+            0x02: "maintenance_can_restore_performance",
+            0x03: "maintenance_cannot_restore_performance",
+            0x04: "performance_restoration_unknown",
+            0x0E: "Error",
+            0x0F: "N/A",
+        }),
+        EnumField("EvStatusCellBal", 7, shift=4, mask=0x03, states={
+            0x00: "balanced",
+            0x01: "unbalanced",
+            0x02: "Error",
+            0x03: "N/A",
+        }),
+        EnumField("EvActiveCellBal", 7, shift=6, mask=0x03, states={
+            0x00: "not_active",
+            0x01: "active",
+            0x02: "Error",
+            0x03: "N/A",
+        }),
+    ),
+    110: (
+        Field("EvChargerTemp", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.03125, offset=-273, fmt="{:.3f} C"),
+        Field("EvMaxChargerTemp", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.03125, offset=-273, fmt="{:.3f} C"),
+        Field("EvInletTemp", 5, na=0xFF, error=0xFF, reserved=0xFB, offset=-40, fmt="{} C"),
+        Field("EvHVESSTemp", 6, na=0xFF, error=0xFF, reserved=0xFB, offset=-40, fmt="{} C"),
+    ),
+}
+
+# SeID pages: Table 7 (ID stage) and Table 8 (data stage)
+SE_ID_PAGES = {
+    1: (
+        TextChunk("SeEVSEID", 0, 7, 40),
+    ),
+    2: (
+        TextChunk("SeEVSEID", 7, 7, 40),
+    ),
+    3: (
+        TextChunk("SeEVSEID", 14, 7, 40),
+    ),
+    4: (
+        TextChunk("SeEVSEID", 21, 7, 40),
+    ),
+    5: (
+        TextChunk("SeEVSEID", 28, 7, 40),
+    ),
+    6: (
+        TextChunk("SeEVSEID", 35, 5, 40),
+    ),
+    7: (
+        TextChunk("SeSECCID", 0, 7, 70),
+    ),
+    8: (
+        TextChunk("SeSECCID", 7, 7, 70),
+    ),
+    9: (
+        TextChunk("SeSECCID", 14, 7, 70),
+    ),
+    10: (
+        TextChunk("SeSECCID", 21, 7, 70),
+    ),
+    11: (
+        TextChunk("SeSECCID", 28, 7, 70),
+    ),
+    12: (
+        TextChunk("SeSECCID", 35, 7, 70),
+    ),
+    13: (
+        TextChunk("SeSECCID", 42, 7, 70),
+    ),
+    14: (
+        TextChunk("SeSECCID", 49, 7, 70),
+    ),
+    15: (
+        TextChunk("SeSECCID", 56, 7, 70),
+    ),
+    16: (
+        TextChunk("SeSECCID", 63, 7, 70),
+    ),
+    17: (
+        TextChunk("SeSerialNum", 0, 7, 42),
+    ),
+    18: (
+        TextChunk("SeSerialNum", 7, 7, 42),
+    ),
+    19: (
+        TextChunk("SeSerialNum", 14, 7, 42),
+    ),
+    20: (
+        TextChunk("SeSerialNum", 21, 7, 42),
+    ),
+    21: (
+        TextChunk("SeSerialNum", 28, 7, 42),
+    ),
+    22: (
+        TextChunk("SeSerialNum", 35, 7, 42),
+    ),
+    23: (
+        TextChunk("SeFirmwareRevision", 0, 7, 28),
+    ),
+    24: (
+        TextChunk("SeFirmwareRevision", 7, 7, 28),
+    ),
+    25: (
+        TextChunk("SeFirmwareRevision", 14, 7, 28),
+    ),
+    26: (
+        TextChunk("SeFirmwareRevision", 21, 7, 28),
+    ),
+    27: (
+        TextChunk("SeManufacturer", 0, 7, 42),
+    ),
+    28: (
+        TextChunk("SeManufacturer", 7, 7, 42),
+    ),
+    29: (
+        TextChunk("SeManufacturer", 14, 7, 42),
+    ),
+    30: (
+        TextChunk("SeManufacturer", 21, 7, 42),
+    ),
+    31: (
+        TextChunk("SeManufacturer", 28, 7, 42),
+    ),
+    32: (
+        TextChunk("SeManufacturer", 35, 7, 42),
+    ),
+    33: (
+        TextChunk("SePublicName", 0, 7, 42),
+    ),
+    34: (
+        TextChunk("SePublicName", 7, 7, 42),
+    ),
+    35: (
+        TextChunk("SePublicName", 14, 7, 42),
+    ),
+    36: (
+        TextChunk("SePublicName", 21, 7, 42),
+    ),
+    37: (
+        TextChunk("SePublicName", 28, 7, 42),
+    ),
+    38: (
+        TextChunk("SePublicName", 35, 7, 42),
+    ),
+    39: (
+        TextChunk("SePlcMac48Address", 0, 6, 6),
+    ),
+    40: (
+        TextChunk("SeWiFiMac64Address1", 0, 7, 8),
+    ),
+    41: (
+        TextChunk("SeWiFiMac64Address1", 7, 1, 8),
+        TextChunk("SeWiFiMac64Address2", 0, 6, 8),
+    ),
+    42: (
+        TextChunk("SeWiFiMac64Address2", 6, 2, 8),
+        TextChunk("SeWiFiMac64Address3", 0, 5, 8),
+    ),
+    43: (
+        TextChunk("SeWiFiMac64Address3", 5, 3, 8),
+        TextChunk("SeWiFiMac64Address4", 0, 4, 8),
+    ),
+    44: (
+        TextChunk("SeWiFiMac64Address4", 4, 4, 8),
+        TextChunk("SeWiFiMac64Address5", 0, 3, 8),
+    ),
+    45: (
+        TextChunk("SeWiFiMac64Address5", 3, 5, 8),
+        TextChunk("SeWiFiMac64Address6", 0, 2, 8),
+    ),
+    46: (
+        TextChunk("SeWiFiMac64Address6", 2, 6, 8),
+        TextChunk("SeWiFiMac64Address7", 0, 1, 8),
+    ),
+    47: (
+        TextChunk("SeWiFiMac64Address7", 1, 7, 8),
+    ),
+    48: (
+        Field("SePropDataIdent", 1, na=0xFF, error=0xFF, reserved=0xFB, fmt="0x{:02X} "),
+        Field("SePropDataRev", 2, na=0xFF, error=0xFF, reserved=0xFB, fmt="{} count"),
+        TextChunk("SePropDataSymb", 0, 5, 5),
+    ),
+    97: (
+        Field("SeAmbientTemp", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.03125, offset=-273, fmt="{:.3f} C"),
+        Field("SeConnectorTemp", 3, na=0xFF, error=0xFF, reserved=0xFB, offset=-40, fmt="{} C"),
+        Field("SeOutletTemp", 4, na=0xFF, error=0xFF, reserved=0xFB, offset=-40, fmt="{} C"),
+        EnumField("SeEvStatusOutletOverride", 5, mask=0x03, states={
+            0x00: "not_active",
+            0x01: "active",
+            0x02: "Error",
+            0x03: "N/A",
+        }),
+        EnumField("SeEvStatusOutletLock", 5, shift=2, mask=0x07, states={
+            0x00: "Unlocked",
+            0x01: "Locked",
+            0x02: "In_transition",
+            0x05: "No_lock",
+            0x06: "Error",
+            0x07: "N/A",
+        }),
+    ),
+    98: (
+        EnumField("SeRmtMgmtStatus", 1, mask=None, states={
+            0x00: "connected",
+            0x01: "connecting",
+            0x02: "not_connected",
+            0x03: "fallback",
+            0x04: "local",
+            0xFE: "error",
+            0xFF: "none_or_status_unknown",
+        }),
+        EnumField("SeEvTripStatus", 2, mask=None, states={
+            0x00: "not_present",
+            0x01: "following",
+            0x02: "cannot_be_met",
+            0xFE: "invalid",
+            0xFF: "not_supported",
+        }),
+        EnumField("SeSeTripStatus", 3, mask=None, states={
+            0x00: "not_present",
+            0x01: "following",
+            0x02: "cannot_be_met",
+            0x03: "EV_precedence",
+            0xFE: "cannot_retrieve",
+            0xFF: "not_supported",
+        }),
+        Field("SeExptTripPerct", 4, na=0xFF, error=0xFF, reserved=0xFB, scale=0.4, fmt="{:.3f} %"),
+    ),
+    99: (
+        Field("SeTimeReqNum", 1, na=0xFF, error=0xFF, reserved=0xFB, fmt="{} count"),
+        Field("SeHVESSRangeCalc", 2, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="{} km"),
+        Field("SeHVESSEnergyCalc", 4, 3, na=0xFF0000, error=0xFF0000, reserved=0xFB0000, scale=0.001, fmt="{:.3f} kWh"),
+    ),
+}
+
+# EvJ3072 pages
+EV_J3072_PAGES = {
+    1: (
+        Field("EvPwrCtrlModesSpt", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="0x{:02X} "),
+        Field("EvSupGridCode1", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="0x{:02X} "),
+        Field("EvSupGridCode2", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="0x{:02X} "),
+    ),
+    2: (
+        Field("EvSupGridCode3", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="0x{:02X} "),
+        Field("EvSupGridCode4", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="0x{:02X} "),
+        Field("EvSupGridCode5", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="0x{:02X} "),
+    ),
+    3: (
+        Field("EvSupGridCode6", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="0x{:02X} "),
+        Field("EvSupGridCode7", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="0x{:02X} "),
+        Field("EvSupGridCode8", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="0x{:02X} "),
+    ),
+    4: (
+        Field("EvSupGridCode9", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="0x{:02X} "),
+        Field("EvSupGridCode10", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="0x{:02X} "),
+        Field("EvSupGridCode11", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="0x{:02X} "),
+        Field("EvRemGridCode", 7, na=0xFF, error=0xFF, reserved=0xFB, fmt="{} count"),
+    ),
+    5: (
+        Field("EvVRefL1N", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.05, fmt="{:.3f} Volts"),
+        Field("EvVRefLL", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.05, fmt="{:.3f} Volts"),
+    ),
+    6: (
+        Field("EvWMaxRtg", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=16, offset=-500000, fmt="{} W"),
+        Field("EvVAMaxRtg", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=16, offset=-500000, fmt="{} VA"),
+        Field("EvIvarMaxRtg", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=16, offset=-500000, fmt="{} VA"),
+    ),
+    7: (
+        Field("EvAvarMaxRtg", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=16, offset=-500000, fmt="{} VA"),
+        Field("EvChaWMaxRtg", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=16, offset=-500000, fmt="{} W"),
+        Field("EvChaVAMaxRtg", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=16, offset=-500000, fmt="{} VA"),
+    ),
+    8: (
+        TextChunk("EvInverterSMN", 0, 7, 32),
+    ),
+    9: (
+        TextChunk("EvInverterSMN", 7, 7, 32),
+    ),
+    10: (
+        TextChunk("EvInverterSMN", 14, 7, 32),
+    ),
+    11: (
+        TextChunk("EvInverterSMN", 21, 7, 32),
+    ),
+    12: (
+        TextChunk("EvInverterSMN", 28, 4, 32),
+    ),
+    13: (
+        TextChunk("EvCertificationDate", 0, 7, 7),
+    ),
+    14: (
+        TextChunk("EvUpdateTime", 0, 7, 7),
+    ),
+}
+
+# SeJ3072 pages
+SE_J3072_PAGES = {
+    1: (
+        Field("SePwrCtrlModesSpt", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, fmt="0x{:02X} "),
+        Field("SeWMaxEVSE", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=16, offset=-500000, fmt="{} W"),
+        Field("SeChaWMaxEVSE", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=16, offset=-500000, fmt="{} W"),
+    ),
+    2: (
+        Field("SeIvarMaxEVSE", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=16, offset=-500000, fmt="{} VA"),
+        Field("SeAvarMaxEVSE", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=16, offset=-500000, fmt="{} VA"),
+    ),
+    3: (
+        TextChunk("SeUpdateTimeEVSE", 0, 7, 7),
+    ),
+    4: (
+        Field("SeFreqOver1FreqA", 1, na=0xFF, error=0xFF, reserved=0xFB, scale=0.1, offset=42.5, fmt="{:.3f} Hz"),
+        Field("SeFreqOver1TimeA", 2, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.01, fmt="{:.3f} seconds"),
+        Field("SeFreqOver2FreqA", 4, na=0xFF, error=0xFF, reserved=0xFB, scale=0.1, offset=42.5, fmt="{:.3f} Hz"),
+        Field("SeFreqOver2TimeA", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.01, fmt="{:.3f} seconds"),
+    ),
+    5: (
+        Field("SeFreqUnder1FreqA", 1, na=0xFF, error=0xFF, reserved=0xFB, scale=0.1, offset=42.5, fmt="{:.3f} Hz"),
+        Field("SeFreqUnder1TimeA", 2, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.01, fmt="{:.3f} seconds"),
+        Field("SeFreqUnder2FreqA", 4, na=0xFF, error=0xFF, reserved=0xFB, scale=0.1, offset=42.5, fmt="{:.3f} Hz"),
+        Field("SeFreqUnder2TimeA", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.01, fmt="{:.3f} seconds"),
+    ),
+    6: (
+        Field("SeLV3hLV2lLNA", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.05, fmt="{:.3f} Volts"),
+        Field("SeLV3TimeA", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.01, fmt="{:.3f} seconds"),
+        Field("SeLV2hLV1lLNA", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.05, fmt="{:.3f} Volts"),
+    ),
+    7: (
+        Field("SeLV2TimeA", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.01, fmt="{:.3f} seconds"),
+        Field("SeLV1hLNA", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.05, fmt="{:.3f} Volts"),
+        Field("SeLV1TimeA", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.01, fmt="{:.3f} seconds"),
+    ),
+    8: (
+        Field("SeHV1lLNA", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.05, fmt="{:.3f} Volts"),
+        Field("SeHV1TimeA", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.01, fmt="{:.3f} seconds"),
+    ),
+    9: (
+        Field("SeHV1hHV2lLNA", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.05, fmt="{:.3f} Volts"),
+        Field("SeHV2TimeA", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.01, fmt="{:.3f} seconds"),
+    ),
+    10: (
+        Field("SeFreqOver1FreqB", 1, na=0xFF, error=0xFF, reserved=0xFB, scale=0.1, offset=42.5, fmt="{:.3f} Hz"),
+        Field("SeFreqOver1TimeB", 2, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.01, fmt="{:.3f} seconds"),
+        Field("SeFreqOver2FreqB", 4, na=0xFF, error=0xFF, reserved=0xFB, scale=0.1, offset=42.5, fmt="{:.3f} Hz"),
+        Field("SeFreqOver2TimeB", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.01, fmt="{:.3f} seconds"),
+    ),
+    11: (
+        Field("SeFreqUnder1FreqB", 1, na=0xFF, error=0xFF, reserved=0xFB, scale=0.1, offset=42.5, fmt="{:.3f} Hz"),
+        Field("SeFreqUnder1TimeB", 2, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.01, fmt="{:.3f} seconds"),
+        Field("SeFreqUnder2FreqB", 4, na=0xFF, error=0xFF, reserved=0xFB, scale=0.1, offset=42.5, fmt="{:.3f} Hz"),
+        Field("SeFreqUnder2TimeB", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.01, fmt="{:.3f} seconds"),
+    ),
+    12: (
+        Field("SeLV3hLV2lLNB", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.05, fmt="{:.3f} Volts"),
+        Field("SeLV3TimeB", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.01, fmt="{:.3f} seconds"),
+        Field("SeLV2hLV1lLNB", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.05, fmt="{:.3f} Volts"),
+    ),
+    13: (
+        Field("SeLV2TimeB", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.01, fmt="{:.3f} seconds"),
+        Field("SeLV1hLNB", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.05, fmt="{:.3f} Volts"),
+        Field("SeLV1TimeB", 5, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.01, fmt="{:.3f} seconds"),
+    ),
+    14: (
+        Field("SeHV1lLNB", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.05, fmt="{:.3f} Volts"),
+        Field("SeHV1TimeB", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.01, fmt="{:.3f} seconds"),
+    ),
+    15: (
+        Field("SeHV1hHV2lLNB", 1, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.05, fmt="{:.3f} Volts"),
+        Field("SeHV2TimeB", 3, 2, na=0xFF00, error=0xFF00, reserved=0xFB00, scale=0.01, fmt="{:.3f} seconds"),
+    ),
+}
+
+
+def id_control_page(ctx, prefix, device, databytes):
+    # As per Table 3 & Table 11 (EV), Table 6 & Table 14 (SE)
+    if len(databytes) >= 7:
+        status = IdStatus(databytes[1])
+        crc_status_str = format_crc_status(databytes[5], device)
+        num_prop_pages_str = format_Num_Prop_Pages(databytes[6], device)
+
+        ctx.update_op(f"{prefix}IDStatus", status)
+        ctx.update_op(f"{prefix}NumIDPages", str(databytes[2]))
+        ctx.update_op(f"{prefix}FirstIDPage", str(databytes[3]))
+        ctx.update_op(f"{prefix}LastIDPage", str(databytes[4]))
+        ctx.update_op(f"{prefix}CrcStatus", crc_status_str)
+        ctx.update_op(f"{prefix}NumPropPages", str(num_prop_pages_str))
+
+
+def j3072_control_page(ctx, prefix, device, databytes):
+    if len(databytes) >= 6:
+        status = J3072Status(databytes[1])
+        crc_status_str = format_j3072_crc_status(databytes[5], device)
+
+        ctx.update_op(f"{prefix}J3072Status", status)
+        ctx.update_op(f"{prefix}NumJ3072Pages", str(databytes[2]))
+        ctx.update_op(f"{prefix}FirstJ3072Page", str(databytes[3]))
+        ctx.update_op(f"{prefix}LastJ3072Page", str(databytes[4]))
+        ctx.update_op(f"{prefix}J3072CrcStatus", crc_status_str)
+
+
+CRC_PAGE = 251
+
+
+class PagedFrame:
+    """
+    Decoder for a frame multiplexed on its first data byte. Page 0 is the
+    control page, the remaining pages come from a {page: signals} table.
+    Staged frames also collect pages 1-250 for the CRC32 sent on page 251.
+    """
+
+    def __init__(self, name, device, pages, control, staged=False):
+        self.name = name
+        self.prefix = name[:2]
+        self.device = device
+        self.control = control
+        self.staged = staged
+        self.pages = {page: tuple(signal.bind(page) for signal in signals)
+                      for page, signals in pages.items()}
+        self.interpretation = f"  Interpretation: {name}"
+        self.page_key = f"{name}Page"
+        self.control_line = f"    {name} Control Page: 0"
+        self.crc_lines = (f"   {self.prefix}Crc32 Page: {CRC_PAGE}", f"   {self.prefix}Crc32 from frame = 0x")
+
+    def __call__(self, ctx, databytes):
+        ctx.display(self.interpretation)
+        page = databytes[0]
+        ctx.update_op(self.page_key, str(page))
+
+        if self.staged and 0 < page < CRC_PAGE:
+            ctx.stage_bytes[self.name].extend(databytes)
+
+        if page == 0:
+            ctx.display(self.control_line)
+            self.control(ctx, self.prefix, self.device, databytes)
+            return
+
+        signals = self.pages.get(page)
+        if signals is not None:
+            page_buffer = ctx.page_buffers[self.name]
+            for signal in signals:
+                signal.apply(ctx, databytes, page_buffer)
+        elif self.staged and page == CRC_PAGE:
+            self.check_crc(ctx, databytes)
+
+    def check_crc(self, ctx, databytes):
+        stage_bytes = ctx.stage_bytes[self.name]
+        crc32 = (databytes[4] << 24) | (databytes[3] << 16) | (databytes[2] << 8) | (databytes[1])
+        ctx.display(self.crc_lines[0])
+        ctx.display(f"{self.crc_lines[1]}{crc32:08X}")
+        is_match, computed_crc = crc_check(crc32, stage_bytes)
+        if is_match:
+            ctx.display(f"    <b><span style='color:green;'>    &nbsp;&nbsp;&nbsp;CRC Check: MATCH</span></b> (Computed: 0x{computed_crc:08X})")
+        else:
+            ctx.display(f"    <b><span style='color:red;'>    &nbsp;&nbsp;&nbsp;CRC Check: MISMATCH</span></b> (Computed: 0x{computed_crc:08X})")
+            ctx.add_event("crc")
+
+        stage_bytes.clear()
+
+
+FRAME_DECODERS = {
+    0: decode_se_version_list,
+    1: decode_ev_version_list,
+    2: decode_se_status,
+    3: decode_ev_status,
+    4: decode_ev_present_currents,
+    5: decode_se_nom_voltages,
+    6: decode_se_max_currents,
+    7: decode_ev_max_voltages,
+    8: decode_ev_min_voltages,
+    9: decode_ev_max_min_currents,
+    0x0A: decode_cable_node,
+    0x0B: decode_se_info_list,
+    0x0C: decode_ev_info_list,
+    0x0F: PagedFrame("EvID", "EV", EV_ID_PAGES, id_control_page, staged=True),
+    0x10: PagedFrame("SeID", "SE", SE_ID_PAGES, id_control_page, staged=True),
+    0x15: decode_ev_mode_ctrl,
+    0x16: decode_se_mode_ctrl,
+    0x17: PagedFrame("EvJ3072", "EV", EV_J3072_PAGES, j3072_control_page),
+    0x18: PagedFrame("SeJ3072", "SE", SE_J3072_PAGES, j3072_control_page),
+    0x19: decode_se_targets1,
+
+    # Add new frame decoders here
+}
+
+# Frames whose decoding depends on nothing but their payload, so the result of
+# one decode can be replayed for the next frame with the same payload. Cable
+# Node frames record their frame number and the paged frames buffer pages.
+PURE_FRAME_IDS = frozenset(FRAME_DECODERS) - {0x0A, 0x0F, 0x10, 0x17, 0x18}
+
+
+def decode_frame(ctx, frame_id, databytes):
+    """Decodes one valid frame into ctx. Returns False if the frame ID has no decoder."""
+    decoder = FRAME_DECODERS.get(frame_id)
+    if decoder is None:
+        return False
+    decoder(ctx, databytes)
+    return True
@@ -0,0 +1,257 @@
+"""
+Compact store of the raw frames of a session, and their per-frame metadata.
+
+Every frame is FRAME_LENGTH bytes, so FrameStore keeps them back to back in a
+single bytearray instead of one bytes object (or list of hex strings) per
+frame: a million frames take 12 MB. Frames are numbered from 1 like the
+slider.
+
+Next to the raw bytes the store keeps one column per piece of metadata, each
+a flat array indexed by frame number - 1:
+
+    valid     bytearray, 1 for a valid frame
+    ids       bytearray, the frame ID (protected ID & 0x3F)
+    times     array('d'), the arrival time, NaN when the frame was not timed
+    errors    bytearray, ERROR_* flags saying why a frame is invalid
+
+so questions over many frames (every invalid frame, every frame of an ID in a
+range, counts by ID in a window) run as NumPy operations over a column
+instead of a Python loop over frames. The trash bytes found between frames
+are kept with the number of frames before them, so write_hex() exports the
+stream as it came in. FrameView is a two-slot handle on one
+frame that reads its fields out of the store on demand:
+
+    store = FrameStore()
+    store.extend(frames)
+    frame = store.view(1)
+    frame.frame_id, frame.payload, frame.checksum, frame.valid, frame.timestamp
+"""
+
+import math
+from array import array
+from itertools import repeat
+
+import numpy as np
+
+from data_processing import FRAME_LENGTH
+
+# Flags of the errors column
+ERROR_PROTECTED_ID = 0x01
+ERROR_CHECKSUM = 0x02
+ERROR_DECODE = 0x04
+
+
+class FrameView:
+    """One frame of a FrameStore."""
+    __slots__ = ("store", "number")
+
+    def __init__(self, store, number):
+        self.store = store
+        self.number = number
+
+    @property
+    def data(self):
+        return self.store.frame(self.number)
+
+    @property
+    def protected_id(self):
+        return self.store.byte(self.number, 2)
+
+    @property
+    def frame_id(self):
+        return self.store.ids[self.number - 1]
+
+    @property
+    def payload(self):
+        return self.data[3:-1]
+
+    @property
+    def checksum(self):
+        return self.store.byte(self.number, FRAME_LENGTH - 1)
+
+    @property
+    def valid(self):
+        return bool(self.store.valid[self.number - 1])
+
+    @property
+    def error(self):
+        return self.store.errors[self.number - 1]
+
+    @property
+    def timestamp(self):
+        """Arrival time of the frame, or None if it was not timed."""
+        return self.store.timestamp(self.number)
+
+    def __repr__(self):
+        return f"FrameView({self.number}, {self.data.hex(' ').upper()})"
+
+
+class FrameStore:
+    """
+    Raw frames in arrival order, with their metadata columns. Appended frames
+    are valid, untimed and without errors until set_errors(), set_error() or
+    set_time() say otherwise.
+    """
+
+    def __init__(self):
+        self._data = bytearray()
+        self.valid = bytearray()
+        self.ids = bytearray()
+        self.times = array('d')
+        self.errors = bytearray()
+        self.garbage = []
+
+    def __len__(self):
+        return len(self.ids)
+
+    def clear(self):
+        # Cleared in place: other objects hold on to the columns
+        self._data.clear()
+        self.valid.clear()
+        self.ids.clear()
+        del self.times[:]
+        self.errors.clear()
+        self.garbage.clear()
+
+    def append(self, frame):
+        self.extend((frame,))
+
+    def extend(self, frames):
+        data = self._data
+        start = len(data)
+        ids = self.ids
+        count = 0
+        for frame in frames:
+            if len(frame) != FRAME_LENGTH:
+                del data[start:]
+                del ids[len(ids) - count:]
+                raise ValueError(f"frames must be {FRAME_LENGTH} bytes long")
+            data += frame
+            ids.append(frame[2] & 0x3F)
+            count += 1
+        self.valid.extend(repeat(1, count))
+        self.times.extend(repeat(math.nan, count))
+        self.errors.extend(bytes(count))
+
+    def add_garbage(self, position, data):
+        """Keeps trash bytes that came after the first position frames."""
+        if data:
+            self.garbage.append((position, bytes(data)))
+
+    def _offset(self, number):
+        if not 0 < number <= len(self):
+            raise IndexError(f"frame {number} is not in the store")
+        return (number - 1) * FRAME_LENGTH
+
+    def frame(self, number):
+        """Returns the raw bytes of frame number."""
+        start = self._offset(number)
+        return bytes(self._data[start:start + FRAME_LENGTH])
+
+    def byte(self, number, index):
+        """Returns byte index of frame number without copying the frame."""
+        return self._data[self._offset(number) + index]
+
+    def view(self, number):
+        self._offset(number)
+        return FrameView(self, number)
+
+    # -------------- metadata ---------------------
+    def is_valid(self, number):
+        """Returns whether frame number is valid, or None for an unknown frame."""
+        if 0 < number <= len(self):
+            return bool(self.valid[number - 1])
+        return None
+
+    def set_errors(self, start, errors):
+        """Sets the error flags of the frames from start on, and their validity."""
+        errors = np.asarray(errors, dtype=np.uint8)
+        stop = start - 1 + len(errors)
+        self.errors[start - 1:stop] = errors.tobytes()
+        self.valid[start - 1:stop] = (errors == 0).astype(np.uint8).tobytes()
+
+    def set_error(self, number, flag):
+        """Adds an error flag to frame number, which makes it invalid."""
+        self.errors[number - 1] |= flag
+        self.valid[number - 1] = 0
+
+    def set_time(self, number, timestamp):
+        self.times[number - 1] = timestamp
+
+    def timestamp(self, number):
+        """Returns the arrival time of frame number, or None if it was not timed."""
+        if 0 < number <= len(self):
+            timestamp = self.times[number - 1]
+            if not math.isnan(timestamp):
+                return timestamp
+        return None
+
+    def clear_times(self):
+        """Forgets the arrival time of every frame."""
+        times = self.times
+        times[:] = array('d', repeat(math.nan, len(times)))
+
+    # -------------- queries ---------------------
+    def _column(self, column, start, stop):
+        # Slicing copies, so no buffer of the growing column stays exported
+        stop = len(self) if stop is None else min(stop, len(self))
+        start = max(start, 1)
+        return np.frombuffer(column[start - 1:max(stop, start - 1)], dtype=np.uint8), start
+
+    def rows(self, start=1, stop=None):
+        """
+        Returns frames start..stop (inclusive, default to the last one) as an
+        (N, FRAME_LENGTH) uint8 array. The array is a copy, so the store can
+        keep growing while it is in use.
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        if stop < start:
+            return np.empty((0, FRAME_LENGTH), dtype=np.uint8)
+        data = self._data[(start - 1) * FRAME_LENGTH:stop * FRAME_LENGTH]
+        return np.frombuffer(data, dtype=np.uint8).reshape(-1, FRAME_LENGTH)
+
+    def invalid_frames(self, start=1, stop=None):
+        """Returns the numbers of the invalid frames in start..stop."""
+        valid, start = self._column(self.valid, start, stop)
+        return np.flatnonzero(valid == 0) + start
+
+    def frames_with_error(self, flag, start=1, stop=None):
+        """Returns the numbers of the frames in start..stop with an error flag."""
+        errors, start = self._column(self.errors, start, stop)
+        return np.flatnonzero(errors & flag) + start
+
+    def frames_with_id(self, frame_id, start=1, stop=None):
+        """Returns the numbers of the frames of frame_id in start..stop."""
+        ids, start = self._column(self.ids, start, stop)
+        return np.flatnonzero(ids == frame_id) + start
+
+    def count_by_id(self, start=1, stop=None):
+        """Returns the number of frames of every frame ID in start..stop, indexed by ID."""
+        ids, _ = self._column(self.ids, start, stop)
+        return np.bincount(ids, minlength=0x40)
+
+    # -------------- re-decode and export ---------------------
+    def chunks(self, start=1, stop=None):
+        """
+        Generator of ('frame', bytes) chunks for frames start..stop, in the form
+        LinDecoder.decode() takes, so stored frames can be decoded again.
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        for number in range(max(start, 1), stop + 1):
+            yield 'frame', self.frame(number)
+
+    def write_hex(self, f):
+        """
+        Writes every frame, and the trash bytes between them, to the text file f
+        as lines of spaced hex, in the order they came in.
+        """
+        data = self._data
+        garbage = iter(self.garbage)
+        position, chunk = next(garbage, (None, None))
+        for number in range(len(self) + 1):
+            while position == number:
+                f.write(chunk.hex(" ").upper() + "\n")
+                position, chunk = next(garbage, (None, None))
+            if number < len(self):
+                start = number * FRAME_LENGTH
+                f.write(data[start:start + FRAME_LENGTH].hex(" ").upper() + "\n")
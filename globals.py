@@ -1,19 +1,22 @@
 # globals.py
-
-from PyQt5.QtCore import QTimer
+from array import array
 
 #   Core variables for serial and live data
 ser = None
-live_data_log = []
 auto_update = True
 live_data_state = False
 na_toggle_active = False
 
 
 frame_time_active = False
-all_frame_types = []
-frame_timestamps = {}
+# Arrival time of every frame, indexed by frame number - 1 (NaN when unknown).
+# main.py points this at the times column of the decoder's FrameStore.
+frame_times = array('d')
 live_data_start_time = 0
+# Display repaints per second while frames stream in (0 = no limit)
+render_rate_hz = 15
+# Bytes of panel HTML kept to redraw recently shown frames quickly
+render_cache_bytes = 8 * 1024 * 1024
 
 # Additional display widgets
 task_operation_display = None
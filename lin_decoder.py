@@ -0,0 +1,250 @@
+"""
+Headless LIN decoder.
+
+LinDecoder takes the (chunk_type, bytes) chunks produced by the framers,
+validates and decodes every frame with frame_decoders, and passes one
+DecodeRecord per chunk to its subscribers. It owns the decoded state but
+knows nothing about Qt. Decodes of PURE_FRAME_IDS frames are memoized by
+frame ID and payload.
+
+    decoder = LinDecoder()
+    decoder.subscribe(lambda record: print(record.frame_number, record.changes))
+    decoder.decode(chunks)
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from data_processing import validate_frames
+from event_index import EventIndex, EVENT_KINDS, STATUS_EVENT_KEYS
+from frame_store import FrameStore, ERROR_PROTECTED_ID, ERROR_CHECKSUM, ERROR_DECODE
+from frame_decoders import decode_frame, FRAME_TYPE_NAMES, PURE_FRAME_IDS
+
+# Distinct (frame ID, payload) decodes kept by LinDecoder
+DECODE_CACHE_SIZE = 1024
+
+
+class DecodeRecord:
+    """
+    Result of decoding one chunk.
+
+    kind is 'frame' or 'garbage'. For frames, intact is True when the protected
+    ID parity and checksum match, and valid is True when the frame was also
+    decoded without an error. lines holds the interpretation lines of the
+    debug log, and changes the (table, key, value) state deltas of the frame,
+    where table is "init", "op" or "ver".
+    """
+    __slots__ = ("kind", "frame_number", "data", "frame_id", "frame_type", "protected_id",
+                 "computed_protected_id", "checksum", "computed_checksum", "intact", "valid",
+                 "lines", "changes", "error")
+
+    def __init__(self, kind, frame_number, data):
+        self.kind = kind
+        self.frame_number = frame_number
+        self.data = data
+        self.frame_id = None
+        self.frame_type = None
+        self.protected_id = None
+        self.computed_protected_id = None
+        self.checksum = None
+        self.computed_checksum = None
+        self.intact = False
+        self.valid = False
+        self.lines = []
+        self.changes = []
+        self.error = None
+
+    @property
+    def databytes(self):
+        return self.data[3:-1]
+
+
+class LinDecoder:
+    """
+    Decodes framed chunks into DecodeRecords and keeps the decoded state.
+    The decoder itself is the ctx passed to the frame_decoders.
+    """
+
+    def __init__(self, cache_size=DECODE_CACHE_SIZE):
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache = OrderedDict()
+        self.frames_parsed = 0
+        self.last_valid_frame = None
+        self.frames = FrameStore()
+        self.events = {kind: EventIndex() for kind in EVENT_KINDS}
+        self.init_data = {}
+        self.op_data = {}
+        self.ver_data = {}
+        self.page_buffers = {"EvID": {}, "SeID": {}, "EvJ3072": {}, "SeJ3072": {}}
+        self.stage_bytes = {"EvID": bytearray(), "SeID": bytearray()}
+        self.cable_node_frames = []
+        self._subscribers = []
+        self._record = None
+        self._tables = {"init": self.init_data, "op": self.op_data, "ver": self.ver_data}
+
+    def subscribe(self, callback):
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        self._subscribers.remove(callback)
+
+    def reset(self):
+        """Clears all decoded state, keeping the subscribers."""
+        self.frames_parsed = 0
+        self.last_valid_frame = None
+        self.frames.clear()
+        for index in self.events.values():
+            index.clear()
+        self.init_data.clear()
+        self.op_data.clear()
+        self.ver_data.clear()
+        for page_buffer in self.page_buffers.values():
+            page_buffer.clear()
+        self.clear_stage_bytes()
+        self.cable_node_frames.clear()
+        self._cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def cache_hit_rate(self):
+        """Fraction of cacheable frames served from the decode cache, or None."""
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else None
+
+    def clear_stage_bytes(self):
+        for stage_bytes in self.stage_bytes.values():
+            stage_bytes.clear()
+
+    def decode(self, chunks):
+        """
+        Decodes a batch of (chunk_type, bytes) chunks and returns their records.
+        The validity of every frame in the batch is known before the first
+        record reaches the subscribers.
+        """
+        chunks = list(chunks)
+        first = len(self.frames) + 1
+        self.frames.extend(chunk_data for chunk_type, chunk_data in chunks if chunk_type == 'frame')
+        batch_frames = self.frames.rows(first)
+        _, batch_checksums, batch_protected_ids = validate_frames(batch_frames)
+        batch_errors = (np.where(batch_protected_ids != batch_frames[:, 2], ERROR_PROTECTED_ID, 0)
+                        | np.where(batch_checksums != batch_frames[:, -1], ERROR_CHECKSUM, 0))
+        self.frames.set_errors(first, batch_errors)
+        invalid = self.events["invalid"]
+        for frame_number in (np.flatnonzero(batch_errors) + first).tolist():
+            invalid.add(frame_number)
+        batch_checksums = batch_checksums.tolist()
+        batch_protected_ids = batch_protected_ids.tolist()
+
+        records = []
+        batch_index = -1
+        for chunk_type, chunk_data in chunks:
+            if chunk_type == 'garbage':
+                record = DecodeRecord('garbage', self.frames_parsed, chunk_data)
+                self.frames.add_garbage(self.frames_parsed, chunk_data)
+                if chunk_data:
+                    # Indexed by the frame that follows the trash bytes
+                    self.events["garbage"].add(self.frames_parsed + 1)
+            else:
+                batch_index += 1
+                record = self._decode_frame(chunk_data, batch_checksums[batch_index],
+                                            batch_protected_ids[batch_index])
+            records.append(record)
+            for callback in self._subscribers:
+                callback(record)
+        return records
+
+    def _decode_frame(self, frame_data, computed_checksum, computed_protected_id):
+        self.frames_parsed += 1
+        record = DecodeRecord('frame', self.frames_parsed, frame_data)
+        record.protected_id = frame_data[2]
+        record.frame_id = frame_id = record.protected_id & 0x3F
+        record.frame_type = FRAME_TYPE_NAMES.get(frame_id, f"Unknown Frame {frame_id:02X}")
+        record.checksum = frame_data[-1]
+        record.computed_checksum = computed_checksum
+        record.computed_protected_id = computed_protected_id
+        record.intact = (computed_protected_id == record.protected_id
+                         and computed_checksum == record.checksum)
+        if not record.intact:
+            return record
+
+        self.last_valid_frame = self.frames_parsed
+        cache_key = None
+        if frame_id in PURE_FRAME_IDS:
+            cache_key = (frame_id, bytes(record.databytes))
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                self.cache_hits += 1
+                self._replay(record, *cached)
+                return record
+            self.cache_misses += 1
+
+        self._record = record
+        try:
+            decode_frame(self, frame_id, list(record.databytes))
+            record.valid = True
+        except Exception as e:
+            record.error = str(e)
+            self.mark_invalid(self.frames_parsed)
+        finally:
+            self._record = None
+        if cache_key is not None and record.valid:
+            self._cache[cache_key] = (tuple(record.lines), tuple(record.changes))
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return record
+
+    def _replay(self, record, lines, changes):
+        """Applies a cached decode to the current frame."""
+        frame_number = self.frames_parsed
+        tables = self._tables
+        for table, key, value in changes:
+            if key in STATUS_EVENT_KEYS:
+                self._note_status(tables[table], key, value)
+            tables[table][key] = (value, frame_number)
+        record.lines = list(lines)
+        record.changes = list(changes)
+        record.valid = True
+
+    def mark_invalid(self, frame_number, flag=ERROR_DECODE):
+        """Marks a frame that failed after validation as invalid."""
+        self.frames.set_error(frame_number, flag)
+        self.events["invalid"].add(frame_number)
+
+    def _note_status(self, data, key, value):
+        entry = data.get(key)
+        if entry is None or entry[0] != value:
+            self.events[key].add(self.frames_parsed)
+
+    # -------------- frame_decoders ctx ---------------------
+    @property
+    def frame_number(self):
+        return self.frames_parsed
+
+    def display(self, text):
+        self._record.lines.append(text)
+
+    def add_event(self, kind):
+        self.events[kind].add(self.frames_parsed)
+
+    def update_init(self, key, value):
+        if key in STATUS_EVENT_KEYS:
+            self._note_status(self.init_data, key, value)
+        self.init_data[key] = (value, self.frames_parsed)
+        self._record.changes.append(("init", key, value))
+
+    def update_op(self, key, value):
+        if key in STATUS_EVENT_KEYS:
+            self._note_status(self.op_data, key, value)
+        self.op_data[key] = (value, self.frames_parsed)
+        self._record.changes.append(("op", key, value))
+
+    def update_ver(self, key, value):
+        if key in STATUS_EVENT_KEYS:
+            self._note_status(self.ver_data, key, value)
+        self.ver_data[key] = (value, self.frames_parsed)
+        self._record.changes.append(("ver", key, value))
@@ -0,0 +1,248 @@
+"""
+Dirty tracking for the display panels.
+
+Every update_* panel declares, with the panel_fields decorator, the keys it
+reads from each data timeline:
+
+    @panel_fields(ver=("SeStatusOp", "EvStatusOp"))
+    def update_contactor_state_display(selected_frame, ...):
+
+PanelRefresher renders a list of panels for a slider position. Between two
+positions it asks every timeline which keys changed (StateTimeline.
+changed_keys) and only renders the panels that read one of them, so stepping
+one frame re-renders the few panels fed by that frame instead of all of them.
+Everything is rendered again when the context (N/A and time toggles, time
+origin) changes or a timeline was cleared.
+
+A panel that has to render looks in the RenderCache first. The cache keeps
+what recent renders wrote to the widgets, keyed by the panel, the versions of
+its fields at the selected frame (StateTimeline.version_at) and the context,
+so scrubbing back over frames already shown replays the widget texts instead
+of looking the fields up and building the HTML again. It also skips writes
+that would not change what a widget already shows, which saves Qt from
+parsing and laying out the same HTML again.
+
+Writes to a widget that is not visible, in a collapsed CollapsibleBox or an
+inactive tab, are kept instead of applied. show_deferred() applies the last
+one once the widget is shown, so a hidden panel costs Qt nothing however
+often the slider moves, while the headers of collapsed boxes stay current.
+"""
+
+import sys
+from collections import OrderedDict
+
+# Widget methods RenderCache.track() records
+TRACKED_METHODS = ("setHtml", "setText", "clear", "set_rows", "set_message")
+
+# Estimated bytes of a cache entry besides the texts it holds
+ENTRY_OVERHEAD = 200
+
+
+def panel_fields(**fields):
+    """Declares the keys an update function reads, by timeline name."""
+    def decorate(update):
+        update.fields = {name: frozenset(keys) for name, keys in fields.items()}
+        return update
+    return decorate
+
+
+def merge_fields(*field_sets):
+    """Returns the union of several panel_fields declarations."""
+    merged = {}
+    for fields in field_sets:
+        for name, keys in fields.items():
+            merged[name] = merged.get(name, frozenset()) | keys
+    return merged
+
+
+class Panel:
+    """
+    One panel: render(frame) draws it, fields are the timeline keys it reads,
+    and signature(frame), if given, summarizes any other input, so the panel
+    is also rendered when it changes.
+    """
+    __slots__ = ("render", "fields", "signature", "last_signature")
+
+    def __init__(self, render, fields, signature=None):
+        self.render = render
+        self.fields = fields
+        self.signature = signature
+        self.last_signature = None
+
+    def is_dirty(self, changed):
+        for name, keys in self.fields.items():
+            changed_keys = changed[name]
+            if changed_keys is None or not keys.isdisjoint(changed_keys):
+                return True
+        return False
+
+
+def _text_size(value):
+    """Estimated bytes of a write argument, counting the strings in nested rows."""
+    if isinstance(value, tuple):
+        return sys.getsizeof(value) + sum(_text_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+def keep_scroll_position(widget, write, *args):
+    """Calls write(*args) on widget, keeping its vertical scroll position."""
+    scrollbar = widget.verticalScrollBar() if hasattr(widget, "verticalScrollBar") else None
+    if scrollbar is None:
+        write(*args)
+        return
+    old_value = scrollbar.value()
+    write(*args)
+    scrollbar.setValue(old_value)
+
+
+class RenderCache:
+    """
+    LRU cache of the widget writes made by panel renders, holding at most
+    budget bytes of text. hits and misses count the lookups.
+
+    The widgets a panel writes to must be passed to track() first, which
+    wraps their TRACKED_METHODS so the cache sees every write made to them.
+    Each of those writes replaces the whole content of a widget, so only the
+    last write to a hidden widget is kept for show_deferred().
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._shown = {}
+        self._deferred = {}
+        self._recording = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+        self.size = 0
+
+    def track(self, *widgets):
+        for widget in widgets:
+            for method in TRACKED_METHODS:
+                if hasattr(widget, method):
+                    setattr(widget, method, self._tracked(widget, method, getattr(widget, method)))
+
+    def _tracked(self, widget, method, write):
+        def tracked_write(*args):
+            shown = (method, args)
+            if self._recording is not None:
+                self._recording.append((widget, method, args))
+            key = id(widget)
+            if not widget.isVisible():
+                if self._shown.get(key) == shown:
+                    self._deferred.pop(key, None)
+                else:
+                    self._deferred[key] = (widget, write, shown)
+                return
+            self._deferred.pop(key, None)
+            if self._shown.get(key) != shown:
+                write(*args)
+                self._shown[key] = shown
+        return tracked_write
+
+    def show_deferred(self):
+        """Applies the writes kept for hidden widgets that are visible now."""
+        for key, (widget, write, shown) in list(self._deferred.items()):
+            if widget.isVisible():
+                del self._deferred[key]
+                keep_scroll_position(widget, write, *shown[1])
+                self._shown[key] = shown
+
+    def replay(self, key):
+        """Repeats the writes cached under key and returns True, or returns False."""
+        writes = self._entries.get(key)
+        if writes is None:
+            self.misses += 1
+            return False
+        self.hits += 1
+        self._entries.move_to_end(key)
+        for widget, method, args in writes:
+            keep_scroll_position(widget, getattr(widget, method), *args)
+        return True
+
+    def record(self, key, render, frame):
+        """Runs render(frame) and caches the writes it makes under key."""
+        self._recording = writes = []
+        try:
+            render(frame)
+        finally:
+            self._recording = None
+        size = ENTRY_OVERHEAD + sum(_text_size(arg) for _, _, args in writes for arg in args)
+        if size > self.budget:
+            return
+        self._entries[key] = writes
+        self.size += size
+        while self.size > self.budget:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= ENTRY_OVERHEAD + sum(_text_size(arg) for _, _, args in evicted for arg in args)
+
+
+class PanelRefresher:
+    """
+    Renders the panels whose inputs changed since the last refresh().
+    timelines maps the timeline names used by panel_fields to StateTimelines,
+    and context() returns the display settings every panel depends on.
+    Renders go through cache, a RenderCache, when one is given.
+    """
+
+    def __init__(self, timelines, context, cache=None):
+        self.timelines = timelines
+        self.context = context
+        self.cache = cache
+        self.panels = []
+        self.renders = 0
+        self.skips = 0
+        self._context = None
+        self._generations = None
+        self._seen = None
+
+    def add(self, render, fields, signature=None):
+        self.panels.append(Panel(render, fields, signature))
+
+    def invalidate(self):
+        """Makes the next refresh() render every panel."""
+        self._seen = None
+
+    def refresh(self, frame):
+        context = self.context()
+        generations = tuple(timeline.generation for timeline in self.timelines.values())
+        if generations != self._generations and self.cache is not None:
+            # Cached versions hold value ids of the cleared timelines
+            self.cache.clear()
+        if self._seen is None or context != self._context or generations != self._generations:
+            changed = None
+        else:
+            changed = {name: timeline.changed_keys(self._seen[name], frame)
+                       for name, timeline in self.timelines.items()}
+
+        for number, panel in enumerate(self.panels):
+            signature = panel.signature(frame) if panel.signature is not None else None
+            if changed is None or panel.is_dirty(changed) or signature != panel.last_signature:
+                self._render(number, panel, frame, context, signature)
+                self.renders += 1
+            else:
+                self.skips += 1
+            panel.last_signature = signature
+
+        self._context = context
+        self._generations = generations
+        # A frame past the last commit shows the state of the last commit; frames
+        # committed later may still change it, so remember where the data ended
+        self._seen = {name: min(frame, timeline.last_frame) for name, timeline in self.timelines.items()}
+
+    def _render(self, number, panel, frame, context, signature):
+        cache = self.cache
+        if cache is None:
+            panel.render(frame)
+            return
+        key = (number, context, signature,
+               tuple(self.timelines[name].version_at(keys, frame) for name, keys in panel.fields.items()))
+        if not cache.replay(key):
+            cache.record(key, panel.render, frame)
@@ -0,0 +1,59 @@
+"""
+Frame-rate limit for repainting the displays while frames stream in.
+
+Decoding a burst of frames used to move the slider, and so repaint every
+panel, as the frames came in. RenderScheduler coalesces those requests
+instead: request() only marks a render as due, and the render runs from a
+single-shot QTimer at most rate_hz times per second, showing whatever was
+decoded by then.
+
+    scheduler = RenderScheduler(render_latest_frame, rate_hz=15)
+    scheduler.request()     # after every decoded frame
+    scheduler.flush()       # render now if a render is due
+"""
+
+import math
+import time
+
+from PyQt5.QtCore import QTimer
+
+# Default repaints per second while frames are arriving
+DEFAULT_RENDER_RATE_HZ = 15
+
+
+class RenderScheduler:
+    def __init__(self, render, rate_hz=DEFAULT_RENDER_RATE_HZ):
+        self.render = render
+        self.pending = False
+        self.renders = 0
+        self._last_render = 0.0
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+        self.set_rate(rate_hz)
+
+    def set_rate(self, rate_hz):
+        """Sets the maximum renders per second; 0 or less removes the limit."""
+        self.interval = 1.0 / rate_hz if rate_hz > 0 else 0.0
+
+    def request(self):
+        """Marks a render as due. It runs when the interval since the last one is over."""
+        self.pending = True
+        if not self._timer.isActive():
+            wait = self._last_render + self.interval - time.monotonic()
+            self._timer.start(max(0, math.ceil(wait * 1000)))
+
+    def flush(self):
+        """Runs the due render, if any, right away."""
+        self._timer.stop()
+        if not self.pending:
+            return
+        self.pending = False
+        self._last_render = time.monotonic()
+        self.renders += 1
+        self.render()
+
+    def cancel(self):
+        """Drops the due render, for callers that are about to render themselves."""
+        self._timer.stop()
+        self.pending = False
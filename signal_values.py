@@ -0,0 +1,139 @@
+"""
+Typed signal values.
+
+The decoder stores these in the state dicts instead of display strings. Each
+value is the raw integer from the frame, so it stays small and can be
+compared and used in arithmetic directly; its display text is only built when
+it is rendered (str(), f-strings) and is cached per raw value, so a value that
+appears in thousands of frames is formatted once.
+
+    amps = Amps(32)
+    amps.number     -> 32
+    f"{amps}"       -> "32A"
+    Amps(255).na    -> True
+"""
+
+from data_processing import format_amp_value, format_voltage_value, format_id_status, format_j3072_status
+
+FREQUENCIES = ["None Supported", "50 Hz", "60 Hz", "50 Hz or 60 Hz"]
+FREQUENCY_HZ = [(), (50,), (60,), (50, 60)]
+
+
+class CodedValue(int):
+    """
+    Base class of the typed values. Subclasses implement format_raw(raw) and,
+    where the signal is numeric, number.
+    """
+    __slots__ = ()
+    _texts = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._texts = {}
+
+    @classmethod
+    def format_raw(cls, raw):
+        return str(raw)
+
+    @property
+    def text(self):
+        raw = int(self)
+        text = self._texts.get(raw)
+        if text is None:
+            text = self._texts[raw] = self.format_raw(raw)
+        return text
+
+    @property
+    def na(self):
+        """True when the raw value means the signal is not available."""
+        return False
+
+    @property
+    def number(self):
+        """The value in its unit, or None for N/A and error codes."""
+        return None
+
+    def __str__(self):
+        return self.text
+
+    def __format__(self, format_spec):
+        return format(self.text, format_spec)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({int(self)})"
+
+
+class Amps(CodedValue):
+    """A current in whole amps; 254 is error and 255 N/A."""
+    __slots__ = ()
+
+    @classmethod
+    def format_raw(cls, raw):
+        return format_amp_value(raw)
+
+    @property
+    def na(self):
+        return self == 255
+
+    @property
+    def number(self):
+        return None if self >= 254 else int(self)
+
+
+class Volts(CodedValue):
+    """A voltage in 0.1 V steps; 254.0 V is error, 255.0 V and 6553.5 V N/A."""
+    __slots__ = ()
+
+    @classmethod
+    def format_raw(cls, raw):
+        return format_voltage_value(raw / 10.0)
+
+    @property
+    def na(self):
+        return self in (2550, 65535)
+
+    @property
+    def number(self):
+        return None if self in (2540, 2550, 65535) else self / 10.0
+
+
+class Frequencies(CodedValue):
+    """The supported grid frequencies, coded as an index into FREQUENCIES."""
+    __slots__ = ()
+
+    @classmethod
+    def format_raw(cls, raw):
+        return FREQUENCIES[raw] if raw < len(FREQUENCIES) else "Unknown"
+
+    @property
+    def hz(self):
+        """The frequencies in Hz, as a tuple."""
+        return FREQUENCY_HZ[self] if self < len(FREQUENCY_HZ) else ()
+
+
+class IdStatus(CodedValue):
+    """EvIDStatus / SeIDStatus."""
+    __slots__ = ()
+
+    @classmethod
+    def format_raw(cls, raw):
+        return format_id_status(raw, None)
+
+
+class J3072Status(CodedValue):
+    """EvJ3072Status / SeJ3072Status."""
+    __slots__ = ()
+
+    @classmethod
+    def format_raw(cls, raw):
+        return format_j3072_status(raw, None)
+
+
+def is_na(value):
+    """True for the "N/A" placeholder of a missing key and for N/A coded values."""
+    return value.na if isinstance(value, CodedValue) else value == "N/A"
+
+
+def number_of(value):
+    """The numeric value of a coded value, or None for anything else."""
+    return value.number if isinstance(value, CodedValue) else None
@@ -0,0 +1,339 @@
+"""
+Delta-based history of the decoded state.
+
+A StateTimeline keeps, for every committed frame that changed a value, only
+the fields that changed since the previous commit instead of a full copy of
+the state. state_at(frame) finds the commit at or before a frame by bisecting
+the committed frame numbers, then rebuilds the state by replaying deltas from
+a cursor, so scrubbing the slider one frame at a time only touches the fields
+that changed in between, wherever it is in the session. A full copy of the
+state is checkpointed every checkpoint_interval commits, so a jump to any
+frame replays at most that many deltas no matter how long the session is.
+
+Frames that write the same values again, the common case while charging in a
+steady state, do not get a delta. They only bump the frame number of the
+fields they wrote, recorded as one integer per frame in the touch list of the
+set of keys that frame wrote. The number of deltas therefore grows with the
+number of state changes rather than with the number of frames.
+
+Every delta is also appended to a per-field FieldHistory, so questions about
+a single field (its value at a frame, when it was last written, how often it
+changed) are answered by bisecting that field's own history instead of
+rebuilding the whole state.
+
+changed_keys(old_frame, new_frame) lists the keys written by the deltas and
+touches between two frames, which is what the display refresh needs to know
+to skip the panels that did not change, and version_at(keys, frame) sums up
+the entries of some keys at a frame, which it uses to key its cache.
+"""
+
+from array import array
+from bisect import bisect_right
+
+# Commits between full-state checkpoints. Larger values use less memory on
+# long sessions, smaller values make jumps across the timeline cheaper.
+CHECKPOINT_INTERVAL = 256
+
+# Deltas changed_keys() collects before it gives up and reports everything
+CHANGED_KEYS_LIMIT = 256
+
+
+class FieldHistory:
+    """
+    History of one field as parallel arrays: the frame of every delta that
+    wrote the field, the frame the value was written in, the id of the value
+    in the timeline's interned value table, and the running count of value
+    changes.
+    """
+    __slots__ = ("frames", "write_frames", "value_ids", "changes")
+
+    def __init__(self):
+        self.frames = array('q')
+        self.write_frames = array('q')
+        self.value_ids = array('l')
+        self.changes = array('l')
+
+    def __len__(self):
+        return len(self.frames)
+
+    def index_at(self, frame):
+        """Returns the index of the last update at or before frame, or -1."""
+        return bisect_right(self.frames, frame) - 1
+
+
+class StateTimeline:
+    """
+    History of one state dict (init, op or ver data), holding (value, frame)
+    pairs like the dicts in LinDecoder.
+
+    Changes are staged with stage() as they are decoded and committed for a
+    frame with commit(). A commit that changes at least one value stores a
+    delta of (key, new_entry, old_entry) triples, so deltas can be replayed in
+    either direction. A missing old_entry is None. A commit that changes no
+    value is a touch: its frame is appended to the touch frames of its key
+    set, and the frames of the touched entries are raised to it when a state
+    is read back. A commit that stages nothing is dropped, except the first,
+    which stores an empty delta.
+
+    Delta i * checkpoint_interval also stores a copy of the state after it,
+    which _seek() starts from whenever that is closer than the cursor.
+
+    fields maps every key to its FieldHistory. Values are interned, so a
+    field that flips between a handful of states stores small integers.
+
+    last_frame is the last frame committed, and generation is bumped by
+    every clear(), so a reader can tell whether what it read is still valid.
+    """
+
+    def __init__(self, checkpoint_interval=CHECKPOINT_INTERVAL):
+        self.checkpoint_interval = checkpoint_interval
+        self.frames = array('q')
+        self._deltas = []
+        self._checkpoints = []
+        self._pending = {}
+        self._head = {}
+        self._cursor = -1
+        self._cursor_state = {}
+        self._view = None
+        self._view_frame = None
+        self.fields = {}
+        self._values = []
+        self._value_ids = {}
+        self._keyset_ids = {}
+        self._keysets = []
+        self._touch_frames = []
+        self._key_keysets = {}
+        self.last_frame = 0
+        self.generation = 0
+
+    def __len__(self):
+        return len(self.frames)
+
+    def clear(self):
+        del self.frames[:]
+        self._deltas.clear()
+        self._checkpoints.clear()
+        self._pending.clear()
+        self._head.clear()
+        self._cursor = -1
+        self._cursor_state = {}
+        self._view = None
+        self._view_frame = None
+        self.fields.clear()
+        self._values.clear()
+        self._value_ids.clear()
+        self._keyset_ids.clear()
+        self._keysets.clear()
+        self._touch_frames.clear()
+        self._key_keysets.clear()
+        self.last_frame = 0
+        self.generation += 1
+
+    def stage(self, key, value, frame):
+        """Stages a field update for the next commit."""
+        self._pending[key] = (value, frame)
+
+    def commit(self, frame):
+        """Records the staged updates as the delta, or touch, of frame."""
+        pending = self._pending
+        # The first commit is kept even if it stages nothing, so the state
+        # reads as empty rather than missing from the first valid frame on
+        if not pending and self.frames:
+            return
+        self._view = None
+        self.last_frame = frame
+        if pending and self._is_touch(frame):
+            self._touch(frame)
+            pending.clear()
+            return
+
+        head = self._head
+        delta = tuple((key, entry, head.get(key)) for key, entry in pending.items())
+        for key, (value, write_frame) in pending.items():
+            value_id = self._intern(value)
+            history = self.fields.get(key)
+            if history is None:
+                history = self.fields[key] = FieldHistory()
+                changes = 1
+            else:
+                changes = history.changes[-1] + (history.value_ids[-1] != value_id)
+            history.frames.append(frame)
+            history.write_frames.append(write_frame)
+            history.value_ids.append(value_id)
+            history.changes.append(changes)
+        head.update(pending)
+        pending.clear()
+        if len(self.frames) % self.checkpoint_interval == 0:
+            self._checkpoints.append(dict(head))
+        self.frames.append(frame)
+        self._deltas.append(delta)
+
+    def _is_touch(self, frame):
+        # Every staged entry rewrites, in this frame, the value it already has
+        head = self._head
+        for key, (value, write_frame) in self._pending.items():
+            old_entry = head.get(key)
+            if write_frame != frame or old_entry is None or type(old_entry[0]) is not type(value) \
+                    or old_entry[0] != value:
+                return False
+        return True
+
+    def _touch(self, frame):
+        keys = tuple(self._pending)
+        keyset = self._keyset_ids.get(keys)
+        if keyset is None:
+            keyset = self._keyset_ids[keys] = len(self._keysets)
+            self._keysets.append(keys)
+            self._touch_frames.append(array('q'))
+            for key in keys:
+                self._key_keysets.setdefault(key, []).append(keyset)
+        self._touch_frames[keyset].append(frame)
+
+    def _last_touch(self, keyset, frame):
+        """Returns the last frame at or before frame that touched keyset, or 0."""
+        frames = self._touch_frames[keyset]
+        index = bisect_right(frames, frame)
+        return frames[index - 1] if index else 0
+
+    def _intern(self, value):
+        # Keyed on the type as well, so 1 and "1" (or True) stay distinct
+        token = (type(value), value)
+        value_id = self._value_ids.get(token)
+        if value_id is None:
+            value_id = self._value_ids[token] = len(self._values)
+            self._values.append(value)
+        return value_id
+
+    def _entry_ids(self, key, frame):
+        """Returns the (value id, frame) entry of key as of frame, or None."""
+        history = self.fields.get(key)
+        if history is None:
+            return None
+        index = history.index_at(frame)
+        if index < 0:
+            return None
+        write_frame = history.write_frames[index]
+        for keyset in self._key_keysets.get(key, ()):
+            write_frame = max(write_frame, self._last_touch(keyset, frame))
+        return history.value_ids[index], write_frame
+
+    def entry_at(self, key, frame):
+        """
+        Returns the (value, frame) entry of key as of the last commit at or
+        before frame, or None if key had not been written by then.
+        """
+        entry = self._entry_ids(key, frame)
+        if entry is None:
+            return None
+        return self._values[entry[0]], entry[1]
+
+    def value_at(self, key, frame, default=None):
+        """Returns the value of key as of frame, or default."""
+        entry = self.entry_at(key, frame)
+        return default if entry is None else entry[0]
+
+    def last_changed(self, key, frame):
+        """Returns the frame key was last written in at or before frame, or None."""
+        entry = self.entry_at(key, frame)
+        return None if entry is None else entry[1]
+
+    def change_count(self, key, frame):
+        """Returns how many times the value of key changed at or before frame."""
+        history = self.fields.get(key)
+        if history is None:
+            return 0
+        index = history.index_at(frame)
+        return history.changes[index] if index >= 0 else 0
+
+    def version_at(self, keys, frame):
+        """
+        Returns a hashable token of the entries of keys as of frame. Two frames
+        get equal tokens when every key has the same value and frame at both
+        and the state is empty at both or at neither.
+        """
+        index = self.index_at(frame)
+        if index < 0:
+            return None
+        if self._is_empty(index):
+            return ()
+        return tuple(self._entry_ids(key, frame) for key in keys)
+
+    def changed_keys(self, old_frame, new_frame):
+        """
+        Returns the set of keys whose entry may differ between the states at
+        old_frame and new_frame, or None if the states cannot be compared
+        cheaply: one of them is missing or empty and the other is not, or more
+        than CHANGED_KEYS_LIMIT deltas lie in between.
+        """
+        low, high = sorted((old_frame, new_frame))
+        low_index = self.index_at(low)
+        high_index = self.index_at(high)
+        if low_index < 0 or high_index - low_index > CHANGED_KEYS_LIMIT \
+                or (self._is_empty(low_index) and high_index > low_index):
+            return None if high_index >= 0 else set()
+        keys = set()
+        for delta in self._deltas[low_index + 1:high_index + 1]:
+            keys.update(key for key, _, _ in delta)
+        for keyset, frames in enumerate(self._touch_frames):
+            if bisect_right(frames, high) != bisect_right(frames, low):
+                keys.update(self._keysets[keyset])
+        return keys
+
+    def _is_empty(self, index):
+        """Returns whether the state after delta index is the empty first commit."""
+        return index == 0 and not self._deltas[0]
+
+    def index_at(self, frame):
+        """Returns the index of the last delta at or before frame, or -1."""
+        frames = self.frames
+        index = self._cursor
+        # Most lookups repeat the cursor's frame, one per panel on a refresh
+        if 0 <= index < len(frames) and frames[index] <= frame \
+                and (index + 1 == len(frames) or frames[index + 1] > frame):
+            return index
+        return bisect_right(frames, frame) - 1
+
+    def state_at(self, frame):
+        """
+        Returns the state as of the last commit at or before frame, or None if
+        no value had been written by then. The returned dict is shared between
+        callers and must not be modified.
+        """
+        if self._view is not None and self._view_frame == frame:
+            return self._view
+        index = self.index_at(frame)
+        if index < 0:
+            return None
+        self._seek(index)
+        view = dict(self._cursor_state)
+        for keyset, keys in enumerate(self._keysets):
+            touched = self._last_touch(keyset, frame)
+            if touched:
+                for key in keys:
+                    value, write_frame = view[key]
+                    if write_frame < touched:
+                        view[key] = (value, touched)
+        self._view = view
+        self._view_frame = frame
+        return view
+
+    def _seek(self, index):
+        if index == self._cursor:
+            return
+        checkpoint = index // self.checkpoint_interval
+        checkpoint_index = checkpoint * self.checkpoint_interval
+        if index - checkpoint_index < abs(index - self._cursor):
+            self._cursor = checkpoint_index
+            self._cursor_state = dict(self._checkpoints[checkpoint])
+        state = self._cursor_state
+        while self._cursor < index:
+            self._cursor += 1
+            for key, entry, _ in self._deltas[self._cursor]:
+                state[key] = entry
+        while self._cursor > index:
+            for key, _, old_entry in reversed(self._deltas[self._cursor]):
+                if old_entry is None:
+                    del state[key]
+                else:
+                    state[key] = old_entry
+            self._cursor -= 1
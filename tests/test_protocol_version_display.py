@@ -0,0 +1,60 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import globals
+from state_timeline import StateTimeline
+from update_functions import update_protocol_version_display
+
+
+class FakeWidget:
+    def __init__(self):
+        self.text = None
+
+    def setHtml(self, html):
+        self.text = html
+
+    def setText(self, text):
+        self.text = text
+
+
+class FakeBox:
+    def __init__(self):
+        self.toggle_button = FakeWidget()
+        self.label_header = FakeWidget()
+
+
+def render(timeline, frame):
+    globals.collapsible_selected_protocol_version = box = FakeBox()
+    display, ratings = FakeWidget(), FakeWidget()
+    update_protocol_version_display(frame, timeline, display, lambda fno: f"(Frame: {fno})", ratings,
+                                    globals.protocol_version_names)
+    return display.text, box
+
+
+def test_na_table_before_first_ver_write():
+    timeline = StateTimeline()
+    timeline.commit(1)
+    timeline.commit(2)
+    timeline.stage("SeSelectedVersion", 2, 3)
+    timeline.commit(3)
+
+    for frame in (1, 2):
+        text, box = render(timeline, frame)
+        assert "No Protocol Version data." not in text
+        assert "SeSelectedVersion: <span style='color:#cfcfcf;font-size:8pt;'>N/A</span>" in text
+        assert "grey" in box.label_header.text
+        assert box.toggle_button.text == "Protocol Version:"
+
+    text, box = render(timeline, 3)
+    assert "SeSelectedVersion: 2" in text
+
+
+def test_no_data_before_first_valid_frame():
+    timeline = StateTimeline()
+    timeline.commit(5)
+
+    text, box = render(timeline, 4)
+    assert text == "No Protocol Version data."
+    assert box.label_header.text == ""
@@ -0,0 +1,22 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from state_timeline import StateTimeline
+
+
+def test_leaving_the_empty_first_commit_changes_everything():
+    timeline = StateTimeline()
+    timeline.commit(1)
+    timeline.commit(2)
+    timeline.stage("EvMaxCurrent_L1", 16, 3)
+    timeline.commit(3)
+
+    assert timeline.state_at(0) is None
+    assert timeline.state_at(2) == {}
+    assert timeline.changed_keys(1, 2) == set()
+    # Panels show "no data" for an empty state even when none of their keys are written
+    assert timeline.changed_keys(2, 3) is None
+    assert timeline.version_at(("SeAvailableCurrent_L1",), 2) != \
+        timeline.version_at(("SeAvailableCurrent_L1",), 3)
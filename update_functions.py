@@ -1,5 +1,7 @@
-import re
+from bisect import bisect_right
 from data_processing import format_frame
+from panel_refresh import panel_fields
+from signal_values import is_na, number_of
 import globals
 
 
@@ -21,24 +23,64 @@ def colorize_if_needed(text_value):
         return text_value
 
 
-def update_slider_label(value, frame_validity_map, label):
-    if value in frame_validity_map:
-        if frame_validity_map[value]:
-            is_valid = '<span style="color:green;">Valid Frame</span>'
-        else:
-            is_valid = '<span style="color:red;">Invalid Frame</span>'
-    else:
+# An ordered list of keys for the "ev data" tab.
+EV_DATA_KEYS = (
+    # Keys from op_data (Live Operation & EvID Data Stage)
+    "EvOdometer", "EvStatusInletLatch", "EvStatusInletOverride", "EvStatusInletLock",
+    "EvNumberJ2012Dtcs", "EvJ2012DtcStatus", "EvJ2012DtcCount", "EvHVESSDishargeCapacity",
+    "EvHVESSChargeCapacity", "EvEnergyForDeparture", "EvTimeToDeparture",
+    "EvHVESSRange", "EvFuelRange", "EvEVTimeToEnergyForDept", "EvDurMin", "EvChaDurMax",
+    "EvDschDurMax", "EvTimeReqNum", "EvEVTimeToRange", "EvEVTimeToEnergy",
+    "EvHVESSVoltage", "EvHVESSCurrent", "EvHVESSHealth", "EvHVESSUserSOC",
+    "EvACActivePower", "EvACReactivePower", "EvACFrequency",
+    "EvL1NVolts", "EvL2NVolts", "EvL3NVolts",
+    "EvAmbientTemp", "EvCabinTemp",
+    "EvHVESSCellTemp", "EvMaxHVESSTemp", "EvMinHVESSTemp", "EvHVESSElecTemp",
+    "EvMaxHVESSCellVolt", "EvMinHVESSCellVolt", "EvNumHVESSCellBalancing",
+    "EvStatusCellVoltDiff", "EvStatusCellBal", "EvActiveCellBal",
+    "EvChargerTemp", "EvMaxChargerTemp", "EvInletTemp", "EvHVESSTemp"
+)
+
+# Keys that are being parsed in display_frames for the J3072 tabs
+EV_J3072_KEYS = (
+    "EvPwrCtrlModesSpt", "EvSupGridCode1", "EvSupGridCode2", "EvSupGridCode3", "EvSupGridCode4", "EvSupGridCode5",
+    "EvSupGridCode6", "EvSupGridCode7", "EvSupGridCode8", "EvSupGridCode9", "EvSupGridCode10", "EvSupGridCode11",
+    "EvRemGridCode", "EvVRefL1N", "EvVRefLL", "EvWMaxRtg","EvVAMaxRtg", "EvIvarMaxRtg", "EvAvarMaxRtg",
+    "EvChaWMaxRtg", "EvChaVAMaxRtg", "EvInverterSMN", "EvCertificationDate", "EvUpdateTime"
+)
+
+SE_J3072_KEYS = (
+    "SePwrCtrlModesSpt", "SeWMaxEVSE", "SeChaWMaxEVSE", "SeIvarMaxEVSE", "SeAvarMaxEVSE",
+    "SeUpdateTimeEVSE", "SeFreqOver1FreqA", "SeFreqOver1TimeA", "SeFreqOver2FreqA", "SeFreqOver2TimeA",
+    "SeFreqUnder1FreqA", "SeFreqUnder1TimeA", "SeFreqUnder2FreqA", "SeFreqUnder2TimeA",
+    "SeLV3hLV2lLNA", "SeLV3TimeA", "SeLV2hLV1lLNA", "SeLV2TimeA", "SeLV1hLNA", "SeLV1TimeA",
+    "SeHV1lLNA", "SeHV1TimeA", "SeHV1hHV2lLNA", "SeHV2TimeA", "SeFreqOver1FreqB", "SeFreqOver1TimeB",
+    "SeFreqOver2FreqB", "SeFreqOver2TimeB", "SeFreqUnder1FreqB", "SeFreqUnder1TimeB", "SeFreqUnder2FreqB",
+    "SeFreqUnder2TimeB", "SeLV3hLV2lLNB", "SeLV3TimeB", "SeLV2hLV1lLNB", "SeLV2TimeB", "SeLV1hLNB",
+    "SeLV1TimeB", "SeHV1lLNB", "SeHV1TimeB", "SeHV1hHV2lLNB", "SeHV2TimeB"
+)
+
+
+def update_slider_label(value, frame_store, label):
+    valid = frame_store.is_valid(value)
+    if valid is None:
         is_valid = '<span style="color:black;">Unknown</span>'
+    elif valid:
+        is_valid = '<span style="color:green;">Valid Frame</span>'
+    else:
+        is_valid = '<span style="color:red;">Invalid Frame</span>'
 
     label.setText(f"Frame Number: {value}    {is_valid}")
 
 
+@panel_fields(ver=("SeStatusVer", "SeStatusInit", "SeStatusOp", "EvStatusVer", "EvStatusInit"),
+              op=("EvIDPage", "SeIDPage"))
 def update_task_display(selected_frame, ver_data_timeline, op_data_timeline, task_operation_display, format_frame):
     import globals
     collapsible_task = globals.collapsible_task
 
     # Find the most recent data snapshot at or before the selected frame
-    chosen = next((snap for fno, snap in reversed(ver_data_timeline) if fno <= selected_frame), None)
+    chosen = ver_data_timeline.state_at(selected_frame)
 
     if not chosen:
         task_operation_display.setHtml("No SE/EV status data available.")
@@ -53,10 +95,8 @@ def update_task_display(selected_frame, ver_data_timeline, op_data_timeline, tas
     ei, ei_f = chosen.get("EvStatusInit", ("N/A", 0))
 
     # Find the most recent EvID and SeID frame numbers
-    evID_frame = next((snap["EvIDPage"][1] for fno, snap in reversed(op_data_timeline) if
-                       fno <= selected_frame and "EvIDPage" in snap), None)
-    seID_frame = next((snap["SeIDPage"][1] for fno, snap in reversed(op_data_timeline) if
-                       fno <= selected_frame and "SeIDPage" in snap), None)
+    evID_frame = op_data_timeline.last_changed("EvIDPage", selected_frame)
+    seID_frame = op_data_timeline.last_changed("SeIDPage", selected_frame)
 
     # Compute statuses based on the presence of ID frames
     evID_status = "Complete" if evID_frame else ("Incomplete" if seID_frame else "N/A")
@@ -113,11 +153,12 @@ def update_task_display(selected_frame, ver_data_timeline, op_data_timeline, tas
         collapsible_task.label_header.setText("<span style='color:#cfcfcf;'>N/A</span>")
 
 
+@panel_fields(ver=("SeStatusOp", "EvStatusOp"))
 def update_contactor_state_display(selected_frame, ver_data_timeline, contactor_state_display, format_frame):
     collapsible_contactor_state = globals.collapsible_contactor_state
 
     # Find the most recent data snapshot at or before the selected frame
-    chosen_data = next((snap for fno, snap in reversed(ver_data_timeline) if fno <= selected_frame), None)
+    chosen_data = ver_data_timeline.state_at(selected_frame)
 
     if not chosen_data:
         contactor_state_display.setText("No Contactor data available.")
@@ -172,6 +213,8 @@ def update_contactor_state_display(selected_frame, ver_data_timeline, contactor_
     contactor_state_display.setHtml(html)
 
 
+@panel_fields(ver=("SeSelectedVersion", "SeStatusVer", "SeStatusInit", "SeStatusOp", "SeVersionPageNumber",
+                   "EvSelectedVersion", "EvStatusVer", "EvStatusInit", "EvStatusOp", "EvVersionPageNumber"))
 def update_protocol_version_display(
         selected_frame: int,
         ver_data_timeline: list,
@@ -183,10 +226,7 @@ def update_protocol_version_display(
     collapsible = globals.collapsible_selected_protocol_version
 
 
-    snap = next(
-        (s for f, s in reversed(ver_data_timeline) if f <= selected_frame),
-        None,
-    )
+    snap = ver_data_timeline.state_at(selected_frame)
     if snap is None:
         selected_protocol_version_display.setText("No Protocol Version data.")
         collapsible.toggle_button.setText("Protocol Version:")
@@ -338,6 +378,8 @@ def update_protocol_version_display(
 
 
 
+@panel_fields(ver=("SeVersionPageNumber", *(f"SeSupportedVersion{i}" for i in range(1, 6)),
+                   "EvVersionPageNumber", *(f"EvSupportedVersion{i}" for i in range(1, 6))))
 def update_sesupported_protocol_versions_display(selected_frame, ver_data_timeline, sesupported_protocol_versions_display, format_frame):
 
     collapsible_sesupported_protocol_versions = globals.collapsible_sesupported_protocol_versions
@@ -365,8 +407,9 @@ def update_sesupported_protocol_versions_display(selected_frame, ver_data_timeli
             return f"<span style='color:black;'>Unknown ({val})</span>"
 
     # Find the most recent data for SE and EV respectively
-    chosen_data_se = next((d for f, d in reversed(ver_data_timeline) if f <= selected_frame and "SeVersionPageNumber" in d), None)
-    chosen_data_ev = next((d for f, d in reversed(ver_data_timeline) if f <= selected_frame and "EvVersionPageNumber" in d), None)
+    ver_snap = ver_data_timeline.state_at(selected_frame) or {}
+    chosen_data_se = ver_snap if "SeVersionPageNumber" in ver_snap else None
+    chosen_data_ev = ver_snap if "EvVersionPageNumber" in ver_snap else None
 
     if not chosen_data_se and not chosen_data_ev:
         sesupported_protocol_versions_display.setText("No Supported Versions data available.")
@@ -414,42 +457,11 @@ def update_sesupported_protocol_versions_display(selected_frame, ver_data_timeli
     collapsible_sesupported_protocol_versions.label_header.setText("")
 
 
-def parse_freq_ev(s):
-    """
-    Parse EV Frequency string. Returns a list of integer frequencies.
-    """
-    if "N/A" in s or "#cfcfcf\">N/A</span>" in s:
-        return []
-    frequencies = []
-    # Split by commas, 'and' (case-insensitive), or '&'
-    parts = re.split(r',|\bor\b|&', s, flags=re.IGNORECASE)
-    for part in parts:
-        part = part.strip()
-        # Handle ranges like "50-60 Hz" (case-insensitive)
-        range_match = re.match(r'(\d+)\s*-\s*(\d+)\s*Hz', part, flags=re.IGNORECASE)
-        if range_match:
-            start = int(range_match.group(1))
-            end = int(range_match.group(2))
-            frequencies.extend(range(start, end + 1))
-        else:
-            freq_match = re.search(r'(\d+)\s*Hz', part, flags=re.IGNORECASE)
-            if freq_match:
-                frequencies.append(int(freq_match.group(1)))
-    return frequencies
-
-
-def parse_freq_se(s):
-    """
-    Parse SE Frequency string. Returns an integer frequency or None.
-    """
-    if "N/A" in s or "#cfcfcf\">N/A</span>" in s:
-        return None
-    match = re.search(r'(\d+)\s*Hz', s, flags=re.IGNORECASE)
-    if match:
-        return int(match.group(1))
-    return None
-
-
+@panel_fields(init=("SeNomVoltageL1N", "SeNomVoltageLL", "SeFrequency",
+                    "SeMaxCurrent_L1", "SeMaxCurrent_L2", "SeMaxCurrent_L3", "SeMaxCurrent_N",
+                    "EvMaxVoltageL1N", "EvMaxVoltageLL", "EvMinVoltageL1N", "EvMinVoltageLL", "EvFrequencies",
+                    "EvMaxCurrent_L1", "EvMaxCurrent_L2", "EvMaxCurrent_L3", "EvMaxCurrent_N",
+                    "EvMinCurrent_L1", "EvMinCurrent_L2", "EvMinCurrent_L3"))
 def update_ratings_display(selected_frame, init_data_timeline, ratings_display):
     """
     Fill the 'ratings_display' TextEdit in two columns:
@@ -458,11 +470,7 @@ def update_ratings_display(selected_frame, init_data_timeline, ratings_display):
     """
     collapsible_ratings = globals.collapsible_ratings
 
-    chosen_data = None
-    for (fno, data_dict) in reversed(init_data_timeline):
-        if fno <= selected_frame:
-            chosen_data = data_dict
-            break
+    chosen_data = init_data_timeline.state_at(selected_frame)
     if not chosen_data:
         ratings_display.setText("No Ratings data available.")
         collapsible_ratings.toggle_button.setText(f"Ratings:")
@@ -490,63 +498,39 @@ def update_ratings_display(selected_frame, init_data_timeline, ratings_display):
     ev_minC_l2_str, f_ev_minC_l2 = chosen_data.get("EvMinCurrent_L2", ("N/A", 0))
     ev_minC_l3_str, f_ev_minC_l3 = chosen_data.get("EvMinCurrent_L3", ("N/A", 0))
 
-    def parse_voltage(s):
-        if "N/A" in s or "#cfcfcf\">N/A</span>" in s:
-            return None
-        s = s.replace("V", "").strip()
-        try:
-            val = float(s)
-        except ValueError:
-            return None
-        if val in (6553.5, 254.0, 255.0):
-            return None
-        return val
-
-    def parse_current(s):
-        if "N/A" in s or "#cfcfcf\">N/A</span>" in s:
-            return None
-        s = s.replace("A", "").strip()
-        try:
-            val = float(s)
-        except ValueError:
-            return None
-        if val in (254.0, 255.0):
-            return None
-        return val
-
-    se_nom_l1n = parse_voltage(se_nom_l1n_str)
-    se_nom_ll = parse_voltage(se_nom_ll_str)
-    se_max_l1 = parse_current(se_max_l1_str)
-    se_max_l2 = parse_current(se_max_l2_str)
-    se_max_l3 = parse_current(se_max_l3_str)
-    se_max_n = parse_current(se_max_n_str)
-
-    ev_max_l1n = parse_voltage(ev_max_l1n_str)
-    ev_max_ll = parse_voltage(ev_max_ll_str)
-    ev_min_l1n = parse_voltage(ev_min_l1n_str)
-    ev_min_ll = parse_voltage(ev_min_ll_str)
-    ev_maxC_l1 = parse_current(ev_maxC_l1_str)
-    ev_maxC_l2 = parse_current(ev_maxC_l2_str)
-    ev_maxC_l3 = parse_current(ev_maxC_l3_str)
-    ev_maxC_n = parse_current(ev_maxC_n_str)
-    ev_minC_l1 = parse_current(ev_minC_l1_str)
-    ev_minC_l2 = parse_current(ev_minC_l2_str)
-    ev_minC_l3 = parse_current(ev_minC_l3_str)
-
-    se_freq = parse_freq_se(se_freq_str)
-    ev_freq = parse_freq_ev(ev_freq_str)
+    se_nom_l1n = number_of(se_nom_l1n_str)
+    se_nom_ll = number_of(se_nom_ll_str)
+    se_max_l1 = number_of(se_max_l1_str)
+    se_max_l2 = number_of(se_max_l2_str)
+    se_max_l3 = number_of(se_max_l3_str)
+    se_max_n = number_of(se_max_n_str)
+
+    ev_max_l1n = number_of(ev_max_l1n_str)
+    ev_max_ll = number_of(ev_max_ll_str)
+    ev_min_l1n = number_of(ev_min_l1n_str)
+    ev_min_ll = number_of(ev_min_ll_str)
+    ev_maxC_l1 = number_of(ev_maxC_l1_str)
+    ev_maxC_l2 = number_of(ev_maxC_l2_str)
+    ev_maxC_l3 = number_of(ev_maxC_l3_str)
+    ev_maxC_n = number_of(ev_maxC_n_str)
+    ev_minC_l1 = number_of(ev_minC_l1_str)
+    ev_minC_l2 = number_of(ev_minC_l2_str)
+    ev_minC_l3 = number_of(ev_minC_l3_str)
+
+    # The frequencies are coded values; the "N/A" placeholder of a missing key has none
+    se_freq_hz = getattr(se_freq_str, "hz", ())
+    se_freq = se_freq_hz[0] if se_freq_hz else None
+    ev_freq = getattr(ev_freq_str, "hz", ())
 
     def color_for_volt_range(se_str, ev_min_str, ev_max_str, se_val, ev_min_val, ev_max_val):
-        if "N/A" in se_str or "N/A" in ev_min_str or "N/A" in ev_max_str:
+        if is_na(se_str) or is_na(ev_min_str) or is_na(ev_max_str):
             return "#cfcfcf"
         if se_val is None or ev_min_val is None or ev_max_val is None:
             return "gray"
         return "green" if (ev_min_val <= se_val <= ev_max_val) else "red"
 
     def color_for_current_range(se_str, ev_min_str, se_val, ev_min_val):
-        if "N/A" in se_str or "N/A" in ev_min_str:
-            return "#cfcfcf"
-        if "FF" in se_str.upper() or "FF" in ev_min_str.upper():
+        if is_na(se_str) or is_na(ev_min_str):
             return "#cfcfcf"
         if se_val is None or ev_min_val is None:
             return "gray"
@@ -669,6 +653,7 @@ def update_ratings_display(selected_frame, init_data_timeline, ratings_display):
     ratings_display.setHtml(final_html)
 
 
+@panel_fields(init=("SeAvailableCurrent_L1", "SeAvailableCurrent_L2", "SeAvailableCurrent_L3", "SeAvailableCurrent_N"))
 def update_seavailable_current_display(selected_frame, init_data_timeline, seavailable_current_display, format_frame):
     """
     Display SeAvailableCurrentL1..N in 'seavailable_current_display',
@@ -678,11 +663,7 @@ def update_seavailable_current_display(selected_frame, init_data_timeline, seava
     collapsible_seavailable_current = globals.collapsible_seavailable_current
 
     # This function correctly uses init_data_timeline. The only fix needed is to use format_frame.
-    chosen_data = None
-    for (fno, data_dict) in reversed(init_data_timeline):
-        if fno <= selected_frame:
-            chosen_data = data_dict
-            break
+    chosen_data = init_data_timeline.state_at(selected_frame)
 
     if not chosen_data:
         seavailable_current_display.setText("No SeAvailableCurrent data available.")
@@ -695,16 +676,7 @@ def update_seavailable_current_display(selected_frame, init_data_timeline, seava
     se_avail_l3, f_l3 = chosen_data.get("SeAvailableCurrent_L3", ("N/A", 0))
     se_avail_n, f_n = chosen_data.get("SeAvailableCurrent_N", ("N/A", 0))
 
-    def parse_amp(val):
-        if val == "N/A" or val.endswith('#cfcfcf">N/A</span>'): return None
-        if val.endswith("A"):
-            try:
-                return int(val[:-1])
-            except:
-                return None
-        return None
-
-    amps = [parse_amp(se_avail_l1), parse_amp(se_avail_l2), parse_amp(se_avail_l3), parse_amp(se_avail_n)]
+    amps = [number_of(se_avail_l1), number_of(se_avail_l2), number_of(se_avail_l3), number_of(se_avail_n)]
     valid_amps = [a for a in amps if a is not None]
 
     if not valid_amps:
@@ -747,6 +719,7 @@ def update_seavailable_current_display(selected_frame, init_data_timeline, seava
     collapsible_seavailable_current.toggle_button.setText("SeAvailableCurrent:")
 
 
+@panel_fields(op=("EvOpPresentCurrent_L1", "EvOpPresentCurrent_L2", "EvOpPresentCurrent_L3", "EvOpPresentCurrent_N"))
 def update_evpresent_current_display(selected_frame, op_data_timeline, evpresent_current_display, format_frame):
     """
     Shows EvPresentCurrentL1..N in 'evpresent_current_display' with frame
@@ -756,11 +729,7 @@ def update_evpresent_current_display(selected_frame, op_data_timeline, evpresent
     collapsible_evpresent_current = globals.collapsible_evpresent_current
 
     # FIX: This data is in op_data_timeline, not init_data_timeline
-    chosen_data = None
-    for (fno, data_dict) in reversed(op_data_timeline):
-        if fno <= selected_frame:
-            chosen_data = data_dict
-            break
+    chosen_data = op_data_timeline.state_at(selected_frame)
 
     if not chosen_data:
         evpresent_current_display.setText("No EvPresentCurrent data available.")
@@ -773,16 +742,7 @@ def update_evpresent_current_display(selected_frame, op_data_timeline, evpresent
     ev_pres_l3, f_l3 = chosen_data.get("EvOpPresentCurrent_L3", ("N/A", 0))
     ev_pres_n, f_n = chosen_data.get("EvOpPresentCurrent_N", ("N/A", 0))
 
-    def parse_amp(val):
-        if val == "N/A" or val.endswith('#cfcfcf">N/A</span>'): return None
-        if val.endswith("A"):
-            try:
-                return int(val[:-1])
-            except:
-                return None
-        return None
-
-    amps = [parse_amp(v) for v in [ev_pres_l1, ev_pres_l2, ev_pres_l3, ev_pres_n]]
+    amps = [number_of(v) for v in [ev_pres_l1, ev_pres_l2, ev_pres_l3, ev_pres_n]]
     valid_amps = [a for a in amps if a is not None]
 
     if not valid_amps:
@@ -825,6 +785,8 @@ def update_evpresent_current_display(selected_frame, op_data_timeline, evpresent
     collapsible_evpresent_current.toggle_button.setText("EvPresentCurrent:")
 
 
+@panel_fields(op=("EvOpRequestedCurrent_L1", "EvOpRequestedCurrent_L2", "EvOpRequestedCurrent_L3",
+                  "EvOpRequestedCurrent_N"))
 def update_evrequested_current_display(selected_frame, op_data_timeline, evrequested_current_display, format_frame):
     """
     Shows EvRequestedCurrentL1..N in the 'evrequested_current_display' box,
@@ -832,11 +794,7 @@ def update_evrequested_current_display(selected_frame, op_data_timeline, evreque
     """
     collapsible_evrequested_current = globals.collapsible_evrequested_current
 
-    chosen_data = None
-    for (fno, data_dict) in reversed(op_data_timeline):
-        if fno <= selected_frame:
-            chosen_data = data_dict
-            break
+    chosen_data = op_data_timeline.state_at(selected_frame)
 
     if not chosen_data:
         collapsible_evrequested_current.toggle_button.setText("EvRequestedCurrent:")
@@ -851,21 +809,11 @@ def update_evrequested_current_display(selected_frame, op_data_timeline, evreque
     ev_req_l3, f_l3 = chosen_data.get("EvOpRequestedCurrent_L3", ("N/A", 0))
     ev_req_n, f_n = chosen_data.get("EvOpRequestedCurrent_N", ("N/A", 0))
 
-    def parse_amp(val):
-        if val == "N/A" or val.endswith('#cfcfcf">N/A</span>'):
-            return None
-        if val.endswith("A"):
-            try:
-                return int(val[:-1])
-            except:
-                return None
-        return None
-
     amps = [
-        parse_amp(ev_req_l1),
-        parse_amp(ev_req_l2),
-        parse_amp(ev_req_l3),
-        parse_amp(ev_req_n),
+        number_of(ev_req_l1),
+        number_of(ev_req_l2),
+        number_of(ev_req_l3),
+        number_of(ev_req_n),
     ]
 
     valid_amps = [a for a in amps if a is not None]
@@ -921,9 +869,10 @@ def update_evrequested_current_display(selected_frame, op_data_timeline, evreque
     collapsible_evrequested_current.toggle_button.setText("EvRequestedCurrent:")
 
 
+@panel_fields(init=("EvInfoPageNumber", *(f"EvInfoEntry{i}" for i in range(1, 7))))
 def update_EvInfo_display(selected_frame, init_data_timeline, EvInfo_display, format_frame):
     """
-    Update the 'EvInfo_display' QTextEdit to show
+    Update the 'EvInfo_display' table to show
     EvInfoPageNumber and EvInfoEntry1..6 with their corresponding frame numbers.
     Format:
         EvInfoPageNumber: 0 (Frame #)
@@ -935,14 +884,12 @@ def update_EvInfo_display(selected_frame, init_data_timeline, EvInfo_display, fo
     collapsible_EvInfo = globals.collapsible_EvInfo
 
     # Search init_data_timeline backwards for a dict that has "EvInfoPageNumber"
-    chosen_data = None
-    for (fno, data_dict) in reversed(init_data_timeline):
-        if fno <= selected_frame and "EvInfoPageNumber" in data_dict:
-            chosen_data = data_dict
-            break
+    chosen_data = init_data_timeline.state_at(selected_frame)
+    if chosen_data is not None and "EvInfoPageNumber" not in chosen_data:
+        chosen_data = None
 
     if not chosen_data:
-        EvInfo_display.setText("No EV Info data available.")
+        EvInfo_display.set_message("No EV Info data available.")
         collapsible_EvInfo.toggle_button.setText("EvInfo:")
         collapsible_EvInfo.label_header.setText("")
         return
@@ -1003,45 +950,29 @@ def update_EvInfo_display(selected_frame, init_data_timeline, EvInfo_display, fo
         # FIX: Use format_frame for the time toggle
         frame_lines.append(format_frame(frame_no))
 
-    # Build the final HTML table (two columns: data and frame numbers)
-    html_parts = []
-    html_parts.append(
-        "<table style='border-collapse: collapse; width:100%; table-layout:fixed; text-align:left; margin:0;'>"
-    )
-    html_parts.append("<colgroup><col style='width:70%;'/><col style='width:30%;'/></colgroup>")
-    max_len = max(len(data_lines), len(frame_lines))
-    for i in range(max_len):
-        data = data_lines[i] if i < len(data_lines) else ""
-        frame = frame_lines[i] if i < len(frame_lines) else ""
-        html_parts.append("<tr>")
-        html_parts.append(f"<td style='padding:3px;vertical-align:top;text-align:left'>{data}</td>")
-        html_parts.append(f"<td style='padding:3px;vertical-align:top;text-align:right'>{frame}</td>")
-        html_parts.append("</tr>")
-    html_parts.append("</table>")
-    final_html = "".join(html_parts)
-    EvInfo_display.setHtml(final_html)
+    # Two columns: data and frame numbers
+    EvInfo_display.set_rows(tuple(zip(data_lines, frame_lines)))
 
     hex_values = [val_hex for (val_hex, _) in entry_vals if val_hex.upper() != "FF" and val_hex != "N/A"]
     hex_list_str = ", ".join(hex_values)
     collapsible_EvInfo.toggle_button.setText(f"EvInfo: {hex_list_str}")
 
 
+@panel_fields(init=("SeInfoPageNumber", *(f"SeInfoEntry{i}" for i in range(1, 7))))
 def update_SeInfo_display(selected_frame, init_data_timeline, SeInfo_display, format_frame):
     """
-    Update the 'SeInfo_display' QTextEdit to show
+    Update the 'SeInfo_display' table to show
     SeInfoPageNumber and SeInfoEntry1..6 with their corresponding frame numbers.
     """
     collapsible_SeInfo = globals.collapsible_SeInfo
 
     # Search init_data_timeline backwards for a dict that has "SeInfoPageNumber"
-    chosen_data = None
-    for (fno, data_dict) in reversed(init_data_timeline):
-        if fno <= selected_frame and "SeInfoPageNumber" in data_dict:
-            chosen_data = data_dict
-            break
+    chosen_data = init_data_timeline.state_at(selected_frame)
+    if chosen_data is not None and "SeInfoPageNumber" not in chosen_data:
+        chosen_data = None
 
     if not chosen_data:
-        SeInfo_display.setText("No SE Info data available.")
+        SeInfo_display.set_message("No SE Info data available.")
         collapsible_SeInfo.toggle_button.setText("SeInfo:")
         collapsible_SeInfo.label_header.setText(f"")
         return
@@ -1104,51 +1035,37 @@ def update_SeInfo_display(selected_frame, init_data_timeline, SeInfo_display, fo
         # FIX: Use format_frame for the time toggle
         frame_lines.append(format_frame(frame_no))
 
-    # --- Construct the final HTML table with two columns ---
-    html_parts = []
-    html_parts.append("<div style='text-align:left;'>")
-    html_parts.append(
-        "<table style='border-collapse:collapse;width:100%;table-layout:fixed;text-align:left;margin:0;'>"
-    )
-    html_parts.append("<colgroup><col style='width:70%;'/><col style='width:30%;'/></colgroup>")
-
-    # Determine the maximum number of rows needed
-    max_len = max(len(data_lines), len(frame_lines))
-
-    for i in range(max_len):
-        # Retrieve each column's content, or use an empty string if index out of range
-        data = data_lines[i] if i < len(data_lines) else ""
-        frame = frame_lines[i] if i < len(frame_lines) else ""
-
-        html_parts.append("<tr>")
-        html_parts.append(f"<td style='padding:3px;vertical-align:top;text-align:left'>{data}</td>")
-        html_parts.append(f"<td style='padding:3px;vertical-align:top;text-align:right'>{frame}</td>")
-        html_parts.append("</tr>")
-
-    html_parts.append("</table></div>")
-
-    final_html = "".join(html_parts)
-    SeInfo_display.setHtml(final_html)
+    # Two columns: data and frame numbers
+    SeInfo_display.set_rows(tuple(zip(data_lines, frame_lines)))
 
     hex_values = [val_hex for (val_hex, _) in entry_vals if val_hex.upper() != "FF" and val_hex != "N/A"]
     hex_list_str = ", ".join(hex_values)
     collapsible_SeInfo.toggle_button.setText(f"SeInfo: {hex_list_str}")
 
 
+def cable_node_count(selected_frame):
+    """Returns how many CaProperty frames arrived at or before selected_frame."""
+    # cable_node_frames is in frame order, so the newest frame at or before
+    # selected_frame is found by bisection
+    cable_node_frames = getattr(globals, "cable_node_frames", [])
+    return bisect_right(cable_node_frames, selected_frame, key=lambda x: x["frame"])
+
+
+@panel_fields()
 def update_CableNode_display(selected_frame, format_frame):
     """
     Shows CaProperty data in the 'cable_Node_display' with frame numbers
-    or time, based on the toggle state.
+    or time, based on the toggle state. It reads no timeline, so a refresh
+    compares cable_node_count() instead.
     """
     cable_display = globals.cable_Node_display
     cable_node_frames = getattr(globals, "cable_node_frames", [])
-
-    valid_frames = [frame for frame in cable_node_frames if frame["frame"] <= selected_frame]
-    if not valid_frames:
+    count = cable_node_count(selected_frame)
+    if not count:
         cable_display.setHtml("No CaProperty data available.")
         return
 
-    newest_frame = max(valid_frames, key=lambda x: x["frame"])
+    newest_frame = cable_node_frames[count - 1]
     data_bytes = newest_frame["data"]
     if len(data_bytes) < 8:
         cable_display.setHtml("N/A")
@@ -1202,6 +1119,7 @@ def update_CableNode_display(selected_frame, format_frame):
     cable_display.setHtml("\n".join(html_parts))
 
 
+@panel_fields(op=("SeConnectionType", "EvConnectionType", "EvResponseError", "EvAwake"))
 def update_sleep_connection_display(selected_frame, op_data_timeline, sleep_connection_display, format_frame):
     """
     Update the 'sleep_connection_display' QTextEdit to show
@@ -1210,11 +1128,7 @@ def update_sleep_connection_display(selected_frame, op_data_timeline, sleep_conn
     """
     collapsible_sleep_Connection = globals.collapsible_sleep_Connection
 
-    chosen_data = None
-    for (fno, data_dict) in reversed(op_data_timeline):
-        if fno <= selected_frame:
-            chosen_data = data_dict
-            break
+    chosen_data = op_data_timeline.state_at(selected_frame)
     if not chosen_data:
         sleep_connection_display.setText("No Sleep and Connection data available")
         collapsible_sleep_Connection.toggle_button.setText("Sleep and Connection:")
@@ -1271,14 +1185,16 @@ def update_sleep_connection_display(selected_frame, op_data_timeline, sleep_conn
     sleep_connection_display.setHtml("".join(html))
 
 
+@panel_fields(op=("EvVIN", "EvEMAID", "EvEVCCID", "EvSerialNum", "EvDriverID", "EvVehicleName",
+                  "EvFirmwareRevision", "EvManufacturer", "EvPropDataIdent", "EvPropDataRev", "EvPropDataSymb"))
 def update_Op3EvID_display(selected_frame, op_data_timeline, Op3EvID_display, format_frame):
     """
     Renders the most recent EvID fields for the ID stage in the "ev id stage" tab,
     based on Table 4 of the J3068-1 draft.
     """
-    op_snap = next((s for f, s in reversed(op_data_timeline) if f <= selected_frame), None)
+    op_snap = op_data_timeline.state_at(selected_frame)
     if not op_snap:
-        Op3EvID_display.setText("No EvID stage available.")
+        Op3EvID_display.set_message("No EvID stage available.")
         return
 
     # EV keys.
@@ -1298,10 +1214,7 @@ def update_Op3EvID_display(selected_frame, op_data_timeline, Op3EvID_display, fo
 
     na_strings = {"n/a", "decode error"}
 
-    html = [
-        "<div style='text-align:left;'><table style='border-collapse:collapse;width:100%;table-layout:fixed;text-align:left;'>",
-        "<colgroup><col style='width:70%;'/><col style='width:30%;'/></colgroup>"]
-
+    rows = []
     for key, source in ev_id_keys.items():
         val, frame_no = source.get(key, ("N/A", 0))
 
@@ -1311,24 +1224,21 @@ def update_Op3EvID_display(selected_frame, op_data_timeline, Op3EvID_display, fo
         if globals.na_toggle_active and is_na:
             continue
 
-        html.append(f"<tr><td style='padding:3px;'>{key}: {val}</td>"
-                    f"<td style='text-align:right;padding:3px;'>{format_frame(frame_no)}</td></tr>")
+        rows.append((f"{key}: {val}", format_frame(frame_no)))
 
-    html.append("</table></div>")
-    scrollbar = Op3EvID_display.verticalScrollBar()
-    old_value = scrollbar.value()
-    Op3EvID_display.setHtml("".join(html))
-    scrollbar.setValue(old_value)
+    Op3EvID_display.set_rows(tuple(rows))
 
 
+@panel_fields(op=("SeEVSEID", "SeSECCID", "SeSerialNum", "SeFirmwareRevision", "SeManufacturer", "SePublicName",
+                  "SePlcEui48Address", *(f"SeWiFiEui64Address{i}" for i in range(1, 8))))
 def update_Op3SeID_display(selected_frame, op_data_timeline, Op3SeID_display, format_frame):
     """
     Renders the most recent SeID fields for the ID stage in the "se id stage" tab,
     based on Table 7 of the J3068-1 draft.
     """
-    op_snap = next((s for f, s in reversed(op_data_timeline) if f <= selected_frame), None)
+    op_snap = op_data_timeline.state_at(selected_frame)
     if not op_snap:
-        Op3SeID_display.setText("No SeID stage available.")
+        Op3SeID_display.set_message("No SeID stage available.")
         return
 
     # SE keys. the sewifi stuff not tested
@@ -1351,10 +1261,7 @@ def update_Op3SeID_display(selected_frame, op_data_timeline, Op3SeID_display, fo
 
     na_strings = {"n/a", "decode error"}
 
-    html = [
-        "<div style='text-align:left;'><table style='border-collapse:collapse;width:100%;table-layout:fixed;text-align:left;'>",
-        "<colgroup><col style='width:70%;'/><col style='width:30%;'/></colgroup>"]
-
+    rows = []
     for key, source in se_id_keys.items():
         val, frame_no = source.get(key, ("N/A", 0))
 
@@ -1364,64 +1271,31 @@ def update_Op3SeID_display(selected_frame, op_data_timeline, Op3SeID_display, fo
         if globals.na_toggle_active and is_na:
             continue
 
-        html.append(f"<tr><td style='padding:3px;'>{key}: {val}</td>"
-                    f"<td style='text-align:right;padding:3px;'>{format_frame(frame_no)}</td></tr>")
+        rows.append((f"{key}: {val}", format_frame(frame_no)))
 
-    html.append("</table></div>")
-    scrollbar = Op3SeID_display.verticalScrollBar()
-    old_value = scrollbar.value()
-    Op3SeID_display.setHtml("".join(html))
-    scrollbar.setValue(old_value)
+    Op3SeID_display.set_rows(tuple(rows))
 
 
 # --------------- Paste in Code Gen code for update Functions here -----------------might need this------------------
+@panel_fields(init=EV_DATA_KEYS, op=EV_DATA_KEYS, ver=EV_DATA_KEYS)
 def update_ev_data_tab(selected_frame, init_data, op_data, ver_data, display_widget, format_frame):
     """
     Populates the 'ev data' tab with a consolidated view of EV-related data.
     """
-    # Find the most recent snapshot for each timeline
-    init_snap = next((s for f, s in reversed(init_data) if f <= selected_frame), {})
-    op_snap = next((s for f, s in reversed(op_data) if f <= selected_frame), {})
-    ver_snap = next((s for f, s in reversed(ver_data) if f <= selected_frame), {})
-
-    # An ordered list of keys for the "ev data" tab.
-    ev_keys = [
-        # Keys from op_data (Live Operation & EvID Data Stage)
-        "EvOdometer", "EvStatusInletLatch", "EvStatusInletOverride", "EvStatusInletLock",
-        "EvNumberJ2012Dtcs", "EvJ2012DtcStatus", "EvJ2012DtcCount", "EvHVESSDishargeCapacity",
-        "EvHVESSChargeCapacity", "EvEnergyForDeparture", "EvTimeToDeparture",
-        "EvHVESSRange", "EvFuelRange", "EvEVTimeToEnergyForDept", "EvDurMin", "EvChaDurMax",
-        "EvDschDurMax", "EvTimeReqNum", "EvEVTimeToRange", "EvEVTimeToEnergy",
-        "EvHVESSVoltage", "EvHVESSCurrent", "EvHVESSHealth", "EvHVESSUserSOC",
-        "EvACActivePower", "EvACReactivePower", "EvACFrequency",
-        "EvL1NVolts", "EvL2NVolts", "EvL3NVolts",
-        "EvAmbientTemp", "EvCabinTemp",
-        "EvHVESSCellTemp", "EvMaxHVESSTemp", "EvMinHVESSTemp", "EvHVESSElecTemp",
-        "EvMaxHVESSCellVolt", "EvMinHVESSCellVolt", "EvNumHVESSCellBalancing",
-        "EvStatusCellVoltDiff", "EvStatusCellBal", "EvActiveCellBal",
-        "EvChargerTemp", "EvMaxChargerTemp", "EvInletTemp", "EvHVESSTemp"
-    ]
 
     na_strings = {"n/a", "not_supported", "none_or_status_unknown", "error", "reserved"}
 
-    html = [
-        "<div style='text-align:left;'><table style='border-collapse:collapse;width:100%;table-layout:fixed;text-align:left;'>",
-        "<colgroup><col style='width:70%;'/><col style='width:30%;'/></colgroup>"]
-
+    rows = []
     found_any_data = False
-    for key in ev_keys:
+    for key in EV_DATA_KEYS:
         val, frame_no = ("N/A", 0)
-        # Check snapshots in order of preference: op -> init -> ver
-        source_snap = None
-        if key in op_snap:
-            source_snap = op_snap
-        elif key in init_snap:
-            source_snap = init_snap
-        elif key in ver_snap:
-            source_snap = ver_snap
-
-        if source_snap:
-            val, frame_no = source_snap.get(key, ("N/A", 0))
+        # Check the field histories in order of preference: op -> init -> ver
+        entry = (op_data.entry_at(key, selected_frame)
+                 or init_data.entry_at(key, selected_frame)
+                 or ver_data.entry_at(key, selected_frame))
+
+        if entry:
+            val, frame_no = entry
             found_any_data = True
 
         # Conditionally hide row if toggle is active and value is N/A-like
@@ -1431,59 +1305,51 @@ def update_ev_data_tab(selected_frame, init_data, op_data, ver_data, display_wid
             continue
 
         # Always display the row, showing N/A if the data doesn't exist for the selected frame
-        html.append(f"<tr><td style='padding:3px;'>{key}: {val}</td>"
-                    f"<td style='text-align:right;padding:3px;'>{format_frame(frame_no)}</td></tr>")
+        rows.append((f"{key}: {val}", format_frame(frame_no)))
 
     if not found_any_data:
-        display_widget.setHtml("No EV data available for this frame.")
+        display_widget.set_message("No EV data available for this frame.")
         return
 
-    html.append("</table></div>")
-    scrollbar = display_widget.verticalScrollBar()
-    old_value = scrollbar.value()
-    display_widget.setHtml("".join(html))
-    scrollbar.setValue(old_value)
+    display_widget.set_rows(tuple(rows))
 
 
+@panel_fields(op=("SeAmbientTemp", "SeConnectorTemp", "SeOutletTemp", "SeEvStatusOutletOverride",
+                  "SeEvStatusOutletLock", "SeRmtMgmtStatus", "SeEvTripStatus", "SeSeTripStatus",
+                  "SeExptTripPerct", "SeTimeReqNum", "SeHVESSRangeCalc", "SeHVESSEnergyCalc"))
 def update_se_data_tab(selected_frame, init_data, op_data, ver_data, display_widget, format_frame):
     """
     Populates the 'se data' tab with a consolidated view of SE-related data,
     including fields from Table 8 of the J3068-1 draft.
     """
-    # Find the most recent snapshot for each timeline
-    op_snap = next((s for f, s in reversed(op_data) if f <= selected_frame), {})
-
-    if not op_snap:
-        display_widget.setHtml("<div style='padding:10px;'>No SE data available for this frame.</div>")
+    if not op_data.state_at(selected_frame):
+        display_widget.set_message("No SE data available for this frame.")
         return
 
     # Define all possible SE keys and their sources
     se_keys = {
         # Table 8 Data (from SeID frame, stored in op_data)
-        "SeAmbientTemp": op_snap,
-        "SeConnectorTemp": op_snap,
-        "SeOutletTemp": op_snap,
-        "SeEvStatusOutletOverride": op_snap,
-        "SeEvStatusOutletLock": op_snap,
-        "SeRmtMgmtStatus": op_snap,
-        "SeEvTripStatus": op_snap,
-        "SeSeTripStatus": op_snap,
-        "SeExptTripPerct": op_snap,
-        "SeTimeReqNum": op_snap,
-        "SeHVESSRangeCalc": op_snap,
-        "SeHVESSEnergyCalc": op_snap,
+        "SeAmbientTemp": op_data,
+        "SeConnectorTemp": op_data,
+        "SeOutletTemp": op_data,
+        "SeEvStatusOutletOverride": op_data,
+        "SeEvStatusOutletLock": op_data,
+        "SeRmtMgmtStatus": op_data,
+        "SeEvTripStatus": op_data,
+        "SeSeTripStatus": op_data,
+        "SeExptTripPerct": op_data,
+        "SeTimeReqNum": op_data,
+        "SeHVESSRangeCalc": op_data,
+        "SeHVESSEnergyCalc": op_data,
     }
 
     na_strings = {"n/a", "not_supported", "none_or_status_unknown", "error", "reserved", "invalid"}
 
-    html = [
-        "<div style='text-align:left;'><table style='border-collapse:collapse;width:100%;table-layout:fixed;text-align:left;'>",
-        "<colgroup><col style='width:70%;'/><col style='width:30%;'/></colgroup>"]
-
-    # Iterate through the keys and populate the HTML table
+    # Iterate through the keys and populate the table
+    rows = []
     for key, source in se_keys.items():
-        # Default to "N/A" if the key is not in the source snapshot
-        val, frame_no = source.get(key, ("N/A", 0))
+        # Default to "N/A" if the key has not been written by this frame
+        val, frame_no = source.entry_at(key, selected_frame) or ("N/A", 0)
 
         # Conditionally hide row if toggle is active and value is N/A-like
         val_str_lower = str(val).lower()
@@ -1491,18 +1357,13 @@ def update_se_data_tab(selected_frame, init_data, op_data, ver_data, display_wid
         if globals.na_toggle_active and is_na:
             continue
 
-        html.append(f"<tr><td style='padding:3px;'>{key}: {val}</td>"
-                    f"<td style='text-align:right;padding:3px;'>{format_frame(frame_no)}</td></tr>")
+        rows.append((f"{key}: {val}", format_frame(frame_no)))
 
-    html.append("</table></div>")
-
-    # Preserve scrollbar position when updating the widget
-    scrollbar = display_widget.verticalScrollBar()
-    old_value = scrollbar.value()
-    display_widget.setHtml("".join(html))
-    scrollbar.setValue(old_value)
+    display_widget.set_rows(tuple(rows))
 
 
+@panel_fields(op=("SeIDStatus", "SeNumIDPages", "SeFirstIDPage", "SeLastIDPage", "SeCrcStatus", "SeNumPropPages",
+                  "EvIDStatus", "EvNumIDPages", "EvFirstIDPage", "EvLastIDPage", "EvCrcStatus", "EvNumPropPages"))
 def update_control_page_display(selected_frame, op_data_timeline, control_page_display, format_frame):
     """
     Update the 'control_page_display' to show SE and EV control page data
@@ -1511,7 +1372,7 @@ def update_control_page_display(selected_frame, op_data_timeline, control_page_d
     """
     collapsible_control_page = globals.collapsible_control_page
 
-    snap = next((s for f, s in reversed(op_data_timeline) if f <= selected_frame), None)
+    snap = op_data_timeline.state_at(selected_frame)
 
     if not snap:
         control_page_display.setHtml("No Control Page data available.")
@@ -1573,6 +1434,8 @@ def update_control_page_display(selected_frame, op_data_timeline, control_page_d
 
 # Start of J3068/2 functions
 
+@panel_fields(op=("SeJ3072Status", "SeNumJ3072Pages", "SeFirstJ3072Page", "SeLastJ3072Page", "SeJ3072CrcStatus",
+                  "EvJ3072Status", "EvNumJ3072Pages", "EvFirstJ3072Page", "EvLastJ3072Page", "EvJ3072CrcStatus"))
 def update_OP252_control_page_display(selected_frame, op_data_timeline, OP252_control_page_display, format_frame):
     """
     Update the 'op252 control_page_display' to show SE and EV control page data for J3072
@@ -1581,7 +1444,7 @@ def update_OP252_control_page_display(selected_frame, op_data_timeline, OP252_co
     """
     collapsible_OP252_control_page = globals.collapsible_OP252_control_page
 
-    snap = next((s for f, s in reversed(op_data_timeline) if f <= selected_frame), None)
+    snap = op_data_timeline.state_at(selected_frame)
 
     if not snap:
         OP252_control_page_display.setHtml("No Control Page data available.")
@@ -1642,13 +1505,15 @@ def update_OP252_control_page_display(selected_frame, op_data_timeline, OP252_co
     collapsible_OP252_control_page.label_header.setText("")  # No text next to the toggle button
 
 
+@panel_fields(op=("EvGridCodeStatus", "EvGridCodeStatusMod", "EvInverterState", "EvPwrCtrlModeAck",
+                  "EvPwrCtrlUnitsAvail", "EvPwrCtrlModesAvail"))
 def update_EvModeCtrl_display(selected_frame, op_data_timeline, EvModeCtrl_display, format_frame):
     """
     Update the 'EvModeCtrl_display' to show EV power control mode data.
     """
     collapsible_EvModeCtrl = globals.collapsible_EvModeCtrl
 
-    snap = next((s for f, s in reversed(op_data_timeline) if f <= selected_frame), None)
+    snap = op_data_timeline.state_at(selected_frame)
 
     if not snap:
         EvModeCtrl_display.setHtml("No EvModeCtrl data available.")
@@ -1690,13 +1555,15 @@ def update_EvModeCtrl_display(selected_frame, op_data_timeline, EvModeCtrl_displ
     ack_color = "green" if ack_mode not in ["N/A", "Processing", "Invalid/Reserved", "Normal Charging"] else "gray"
     collapsible_EvModeCtrl.label_header.setText(f"<span style='color:{ack_color};font-size:8pt;'> {ack_mode}</span>")
 
+@panel_fields(op=("SeGridCodeRequest", "SeInverterRequest", "SePwrCtrlMode", "SePwrCtrlUnits", "SePwrCtrlAuth",
+                  "SeTimeStamp"))
 def update_SeModeCtrl_display(selected_frame, op_data_timeline, SeModeCtrl_display, format_frame):
     """
     Update the 'SeModeCtrl_display' to show SE power control mode data.
     """
     collapsible_SeModeCtrl = globals.collapsible_SeModeCtrl_page
 
-    snap = next((s for f, s in reversed(op_data_timeline) if f <= selected_frame), None)
+    snap = op_data_timeline.state_at(selected_frame)
 
     if not snap:
         SeModeCtrl_display.setHtml("No SeModeCtrl data available.")
@@ -1736,100 +1603,70 @@ def update_SeModeCtrl_display(selected_frame, op_data_timeline, SeModeCtrl_displ
     collapsible_SeModeCtrl.label_header.setText(f"<span style='color:{req_color};font-size:8pt;'> {req_mode}</span>")
 
 
+@panel_fields(op=EV_J3072_KEYS)
 def update_EvJ3072_display(selected_frame, op_data_timeline, EvJ3072_tab_display, format_frame):
     """
     Renders the most recent EvJ3072 fields for the certification stage.
     """
-    op_snap = next((s for f, s in reversed(op_data_timeline) if f <= selected_frame), None)
+    op_snap = op_data_timeline.state_at(selected_frame)
     if not op_snap:
-        EvJ3072_tab_display.setHtml("No EvJ3072 data available.")
+        EvJ3072_tab_display.set_message("No EvJ3072 data available.")
         return
 
-    # Keys that are being parsed in display_frames
-    ev_j3072_keys = [
-        "EvPwrCtrlModesSpt", "EvSupGridCode1", "EvSupGridCode2", "EvSupGridCode3", "EvSupGridCode4", "EvSupGridCode5",
-        "EvSupGridCode6", "EvSupGridCode7", "EvSupGridCode8", "EvSupGridCode9", "EvSupGridCode10", "EvSupGridCode11",
-        "EvRemGridCode", "EvVRefL1N", "EvVRefLL", "EvWMaxRtg","EvVAMaxRtg", "EvIvarMaxRtg", "EvAvarMaxRtg",
-        "EvChaWMaxRtg", "EvChaVAMaxRtg", "EvInverterSMN", "EvCertificationDate", "EvUpdateTime"
-    ]
-
     na_strings = {"n/a", "decode error", "not available"}
-    html = ["<div style='text-align:left;'><table style='border-collapse:collapse;width:100%;table-layout:fixed;text-align:left;'>",
-            "<colgroup><col style='width:70%;'/><col style='width:30%;'/></colgroup>"]
-
+    rows = []
     found_any_data = False
-    for key in ev_j3072_keys:
+    for key in EV_J3072_KEYS:
         val, frame_no = op_snap.get(key, ("N/A", 0))
         if val != "N/A":
             found_any_data = True
         if globals.na_toggle_active and any(sub in str(val).lower() for sub in na_strings):
             continue
-        html.append(f"<tr><td style='padding:3px; word-wrap:break-word;'>{key}: {val}</td>"
-                    f"<td style='text-align:right;padding:3px;'>{format_frame(frame_no)}</td></tr>")
+        rows.append((f"{key}: {val}", format_frame(frame_no)))
 
     if not found_any_data:
-        EvJ3072_tab_display.setHtml("No EvJ3072 data available for this frame.")
+        EvJ3072_tab_display.set_message("No EvJ3072 data available for this frame.")
         return
 
-    html.append("</table></div>")
-    scrollbar = EvJ3072_tab_display.verticalScrollBar()
-    old_value = scrollbar.value()
-    EvJ3072_tab_display.setHtml("".join(html))
-    scrollbar.setValue(old_value)
+    EvJ3072_tab_display.set_rows(tuple(rows))
 
 
+@panel_fields(op=SE_J3072_KEYS)
 def update_SeJ3072_display(selected_frame, op_data_timeline, SeJ3072_tab_display, format_frame):
     """
     Renders the most recent SeJ3072 fields for the certification stage.
     """
-    op_snap = next((s for f, s in reversed(op_data_timeline) if f <= selected_frame), None)
+    op_snap = op_data_timeline.state_at(selected_frame)
     if not op_snap:
-        SeJ3072_tab_display.setHtml("No SeJ3072 data available.")
+        SeJ3072_tab_display.set_message("No SeJ3072 data available.")
         return
 
-    # Keys that are being parsed in display_frames
-    se_j3072_keys = [
-        "SePwrCtrlModesSpt", "SeWMaxEVSE", "SeChaWMaxEVSE", "SeIvarMaxEVSE", "SeAvarMaxEVSE",
-        "SeUpdateTimeEVSE", "SeFreqOver1FreqA", "SeFreqOver1TimeA", "SeFreqOver2FreqA", "SeFreqOver2TimeA",
-        "SeFreqUnder1FreqA", "SeFreqUnder1TimeA", "SeFreqUnder2FreqA", "SeFreqUnder2TimeA",
-        "SeLV3hLV2lLNA", "SeLV3TimeA", "SeLV2hLV1lLNA", "SeLV2TimeA", "SeLV1hLNA", "SeLV1TimeA",
-        "SeHV1lLNA", "SeHV1TimeA", "SeHV1hHV2lLNA", "SeHV2TimeA", "SeFreqOver1FreqB", "SeFreqOver1TimeB",
-        "SeFreqOver2FreqB", "SeFreqOver2TimeB", "SeFreqUnder1FreqB", "SeFreqUnder1TimeB", "SeFreqUnder2FreqB",
-        "SeFreqUnder2TimeB", "SeLV3hLV2lLNB", "SeLV3TimeB", "SeLV2hLV1lLNB", "SeLV2TimeB", "SeLV1hLNB",
-        "SeLV1TimeB", "SeHV1lLNB", "SeHV1TimeB", "SeHV1hHV2lLNB", "SeHV2TimeB"
-    ]
-
     na_strings = {"n/a", "decode error", "not available"}
-    html = ["<div style='text-align:left;'><table style='border-collapse:collapse;width:100%;table-layout:fixed;text-align:left;'>",
-            "<colgroup><col style='width:70%;'/><col style='width:30%;'/></colgroup>"]
-
+    rows = []
     found_any_data = False
-    for key in se_j3072_keys:
+    for key in SE_J3072_KEYS:
         val, frame_no = op_snap.get(key, ("N/A", 0))
         if val != "N/A":
             found_any_data = True
         if globals.na_toggle_active and any(sub in str(val).lower() for sub in na_strings):
             continue
-        html.append(f"<tr><td style='padding:3px; word-wrap:break-word;'>{key}: {val}</td>"
-                    f"<td style='text-align:right;padding:3px;'>{format_frame(frame_no)}</td></tr>")
+        rows.append((f"{key}: {val}", format_frame(frame_no)))
 
     if not found_any_data:
-        SeJ3072_tab_display.setHtml("No SeJ3072 data available for this frame.")
+        SeJ3072_tab_display.set_message("No SeJ3072 data available for this frame.")
         return
 
-    html.append("</table></div>")
-    scrollbar = SeJ3072_tab_display.verticalScrollBar()
-    old_value = scrollbar.value()
-    SeJ3072_tab_display.setHtml("".join(html))
-    scrollbar.setValue(old_value)
+    SeJ3072_tab_display.set_rows(tuple(rows))
 
+@panel_fields(op=("SePwrCtrlUnits", "SeTargets1ElementA", "SeTargets1ElementB", "SeTargets1ElementC",
+                  "SeTargets1ElementD"))
 def update_SeTargets1_display(selected_frame, op_data_timeline, SeTargets1_display, format_frame):
     """
     Interpret and display the SeTargets1 frame data based on the selected SePwrCtrlUnits.
     """
     collapsible_SeTargets1 = globals.collapsible_SeTargets1_page
 
-    snap = next((s for f, s in reversed(op_data_timeline) if f <= selected_frame), None)
+    snap = op_data_timeline.state_at(selected_frame)
 
     if not snap or "SeTargets1ElementA" not in snap:
         SeTargets1_display.setHtml("No SeTargets1 data available.")
@@ -0,0 +1,122 @@
+"""
+Sliding-window statistics of the frame types, for the Recent Data debug tab.
+
+WindowStats keeps, for the last `size` frames up to a given frame, the count
+of every frame type and the gaps between the arrival times of consecutive
+frames of that type. Moving the window forward by n frames costs O(n) no
+matter how large the window is; moving it backwards rebuilds it from its new
+start. Min and max gaps are kept in monotonic queues, so they also expire
+in O(1) as frames leave the window.
+"""
+
+from collections import deque
+
+
+class TypeWindow:
+    """
+    Window state of one frame type: the frame count, the (frame, time) pairs
+    of the timed frames, and monotonic queues of (frame, gap) where frame is
+    the later frame of the gap.
+    """
+    __slots__ = ("count", "times", "min_gaps", "max_gaps")
+
+    def __init__(self):
+        self.count = 0
+        self.times = deque()
+        self.min_gaps = deque()
+        self.max_gaps = deque()
+
+    @property
+    def avg_gap(self):
+        """Average time between copies, or None with fewer than two timed copies."""
+        times = self.times
+        if len(times) < 2:
+            return None
+        # The gaps between consecutive copies add up to last - first
+        return (times[-1][1] - times[0][1]) / (len(times) - 1)
+
+    @property
+    def min_gap(self):
+        return self.min_gaps[0][1] if self.min_gaps else None
+
+    @property
+    def max_gap(self):
+        return self.max_gaps[0][1] if self.max_gaps else None
+
+
+class WindowStats:
+    """
+    Statistics over a window of frame_ids, a sequence of the ID of every frame
+    in frame order (such as FrameStore.ids). frame_time(fno) returns the
+    arrival time of a frame, or None. Call reset() whenever frames already in
+    the window change.
+    """
+
+    def __init__(self, frame_ids, frame_time):
+        self.frame_ids = frame_ids
+        self.frame_time = frame_time
+        self.types = {}
+        self.start = 0
+        self.end = 0
+        self.size = 0
+
+    def reset(self, start=0):
+        self.types = {}
+        self.start = self.end = start
+
+    def move_to(self, end, size):
+        """
+        Moves the window to the `size` frames ending at frame number `end`
+        and returns {frame ID: TypeWindow}. IDs that left the window keep an
+        entry with a count of 0.
+        """
+        end = max(0, min(end, len(self.frame_ids)))
+        start = max(0, end - size)
+        if size != self.size or start < self.start or end < self.end or start >= self.end:
+            self.size = size
+            self.reset(start)
+        while self.end < end:
+            self._push()
+        while self.start < start:
+            self._pop()
+        return self.types
+
+    def _push(self):
+        frame_id = self.frame_ids[self.end]
+        self.end += 1
+        fno = self.end
+        window = self.types.get(frame_id)
+        if window is None:
+            window = self.types[frame_id] = TypeWindow()
+        window.count += 1
+        ts = self.frame_time(fno)
+        if ts is None:
+            return
+        if window.times:
+            gap = ts - window.times[-1][1]
+            min_gaps = window.min_gaps
+            while min_gaps and min_gaps[-1][1] >= gap:
+                min_gaps.pop()
+            min_gaps.append((fno, gap))
+            max_gaps = window.max_gaps
+            while max_gaps and max_gaps[-1][1] <= gap:
+                max_gaps.pop()
+            max_gaps.append((fno, gap))
+        window.times.append((fno, ts))
+
+    def _pop(self):
+        frame_id = self.frame_ids[self.start]
+        self.start += 1
+        fno = self.start
+        window = self.types[frame_id]
+        window.count -= 1
+        times = window.times
+        if not times or times[0][0] != fno:
+            return
+        times.popleft()
+        # The gap ending at the new first copy started at the frame that left
+        first = times[0][0] if times else fno + 1
+        while window.min_gaps and window.min_gaps[0][0] <= first:
+            window.min_gaps.popleft()
+        while window.max_gaps and window.max_gaps[0][0] <= first:
+            window.max_gaps.popleft()